@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
+import multiprocessing
+import os
+import struct
+import threading
+import uuid
 import warnings
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import cache, partial
 from io import BytesIO
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+from urllib.parse import quote, urlencode
 
+import numpy as np
 import pandas as pd
-from aiohttp import ClientConnectionError, ClientSession, ClientTimeout
-from requests import Session
-from requests.exceptions import ConnectionError as RequestsConnectionError
 from tenacity import (
     AsyncRetrying,
     Retrying,
@@ -26,24 +35,253 @@ from gdelt_client.filters import Filters
 from gdelt_client.helpers import (
     Date,
     expand_dates,
-    get_cameo_description,
     load_cameo_codes,
     load_json,
     load_schema,
+    load_schema_fields,
+    load_schema_types,
 )
 from gdelt_client.validation import validate_date, validate_table
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is an optional speedup
+    pa = None
+    pa_csv = None
+
+try:
+    import deflate as libdeflate
+except ImportError:  # pragma: no cover - libdeflate is an optional speedup
+    libdeflate = None
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
     import geopandas as gpd
+    from aiohttp import ClientSession
+    from requests import Session
+
+
+# Only advertise Brotli when requests/aiohttp can decode it
+_ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if importlib.util.find_spec("brotli") is not None or importlib.util.find_spec("brotlicffi") is not None
+    else "gzip, deflate"
+)
+
+# Fields of an article in DOC API "artlist" responses, in the order the API returns them
+_ARTICLE_COLUMNS = ("url", "url_mobile", "title", "seendate", "socialimage", "domain", "language", "sourcecountry")
+_ARTICLE_SCHEMA = pa.schema([(column, pa.string()) for column in _ARTICLE_COLUMNS]) if pa is not None else None
+
+# pandas dtypes for the BigQuery column types in the schema files; integers are nullable as GDELT leaves blanks
+_PANDAS_DTYPES = {"INTEGER": "Int64", "FLOAT": "float64", "STRING": "str"}
+
+
+@contextmanager
+def _open_zip_member(data: bytes) -> Iterator[IO[bytes]]:
+    """
+    Open the single member of a GDELT zip archive for reading.
+
+    By default the member is streamed through zlib as the parser consumes it, so the uncompressed file (several
+    times the size of the download) is never held in memory as a whole. With libdeflate installed the member is
+    instead inflated in one call, which is considerably faster than zlib's streaming decompression.
+    """
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        info = zf.infolist()[0]
+        if libdeflate is None or info.compress_type != zipfile.ZIP_DEFLATED:
+            with zf.open(info) as member:
+                yield member
+            return
+
+    with BytesIO(_inflate(data, info)) as buffer:
+        yield buffer
+
+
+def _inflate(data: bytes, info: zipfile.ZipInfo) -> bytes:
+    """Inflate a deflated zip member with libdeflate, into a buffer of the size recorded in the archive."""
+    # The member data follows its local file header: 30 fixed bytes, then the file name and extra field
+    name_length, extra_length = struct.unpack_from("<HH", data, info.header_offset + 26)
+    start = info.header_offset + 30 + name_length + extra_length
+    raw = libdeflate.deflate_decompress(data[start : start + info.compress_size], info.file_size)
+    if zlib.crc32(raw) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return raw
+
+
+def _read_csv_pyarrow(
+    data: bytes,
+    convert_options: pa_csv.ConvertOptions,
+    fallback: Callable[[bytes], pd.DataFrame],
+) -> pd.DataFrame:
+    """
+    Parse a zipped GDELT TSV file with pyarrow's multi-threaded CSV reader.
+
+    Rows with extra fields are skipped, as with the pandas reader. pyarrow cannot pad rows with missing
+    trailing fields, so files containing any are handed to ``fallback`` instead, which keeps them; its
+    result is converted to the same Arrow types, so every file comes back with the same dtypes.
+    """
+    short_rows = False
+
+    def handle_invalid_row(row: pa_csv.InvalidRow) -> str:
+        nonlocal short_rows
+        short_rows = short_rows or row.actual_columns < row.expected_columns
+        return "skip"
+
+    with _open_zip_member(data) as member:
+        table = pa_csv.read_csv(
+            member,
+            read_options=pa_csv.ReadOptions(autogenerate_column_names=True, encoding="latin-1", block_size=8 << 20),
+            parse_options=pa_csv.ParseOptions(delimiter="\t", invalid_row_handler=handle_invalid_row),
+            convert_options=convert_options,
+        )
+    if short_rows:
+        table = _arrow_table_from_pandas(fallback(data), convert_options.column_types)
+    # Arrow-backed columns let pd.concat stitch multi-file results together as chunked arrays, without a copy
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    df.columns = pd.RangeIndex(len(df.columns))
+    return df
+
+
+def _arrow_table_from_pandas(df: pd.DataFrame, column_types: dict[str, pa.DataType]) -> pa.Table:
+    """Convert a frame from the pandas reader to the Arrow table pyarrow's reader would have produced."""
+    table = pa.Table.from_pandas(
+        df.set_axis([f"f{idx}" for idx in range(len(df.columns))], axis=1), preserve_index=False
+    )
+    # Columns outside the schema are inferred; pandas strings convert to large_string, pyarrow's reader gives string
+    schema = pa.schema(
+        (field.name, column_types.get(field.name, pa.string() if pa.types.is_large_string(field.type) else field.type))
+        for field in table.schema
+    )
+    return table.cast(schema)
+
+
+def _read_csv_pandas(data: bytes, dtype: dict[int, str] | None) -> pd.DataFrame:
+    """Parse a zipped GDELT TSV file with the pandas C parser."""
+    with _open_zip_member(data) as member:
+        return pd.read_csv(  # type: ignore[call-overload]
+            member,
+            sep="\t",
+            header=None,
+            on_bad_lines="skip",
+            dtype=dtype,
+            encoding="latin-1",
+            engine="c",
+            # Infer each column once over the whole file instead of per chunk
+            low_memory=False,
+        )
+
+
+@cache
+def _compile_parser(table: GdeltTable, use_pyarrow: bool, strict: bool = True) -> Callable[[bytes], pd.DataFrame]:
+    """
+    Specialize the TSV reader for a table's schema.
+
+    The per-column conversion options are built once per process and table. With ``strict=False`` only
+    the STRING columns are typed and numeric dtypes are inferred, for files whose numbers break the schema.
+    """
+    column_types = {idx: kind for idx, kind in enumerate(load_schema_types(table.value)) if strict or kind == "STRING"}
+
+    dtype = {idx: _PANDAS_DTYPES[kind] for idx, kind in column_types.items()}
+    read_pandas = partial(_read_csv_pandas, dtype=dtype or None)
+    if not use_pyarrow:
+        return read_pandas
+
+    arrow_types = {"INTEGER": pa.int64(), "FLOAT": pa.float64(), "STRING": pa.string()}
+    convert_options = pa_csv.ConvertOptions(
+        column_types={f"f{idx}": arrow_types[kind] for idx, kind in column_types.items()},
+        strings_can_be_null=True,
+    )
+    return partial(_read_csv_pyarrow, convert_options=convert_options, fallback=read_pandas)
+
+
+def _read_gdelt_file(data: bytes, table: GdeltTable) -> pd.DataFrame:
+    """
+    Read compressed GDELT CSV/TSV data into a DataFrame with positional column labels.
+
+    Columns are parsed with the types from the table schema, so no dtype inference is needed. Files
+    that do not fit the schema (e.g. malformed values) are re-read with inferred numeric dtypes instead;
+    string columns such as the zero-padded CAMEO codes are still read as strings.
+
+    Kept at module level so it can be dispatched to a process pool.
+    """
+    use_pyarrow = pa_csv is not None
+    try:
+        return _compile_parser(table, use_pyarrow)(data)
+    except (ValueError, TypeError):
+        # pandas raises TypeError when an INTEGER column holds a non-integral number such as 1.5
+        logger.debug("GDELT file does not match the %s schema types, falling back to dtype inference", table.value)
+        return _compile_parser(table, use_pyarrow, strict=False)(data)
+
+
+def _optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a parsed GDELT frame to smaller dtypes that hold its values exactly.
+
+    Integers are downcast to the narrowest integer type and repetitive string columns (country codes,
+    CAMEO codes, ...) become categoricals. Floats are left as float64, since coordinates and tone scores
+    do not survive a round trip through float32.
+    """
+    for column in df.columns:
+        series = df[column]
+        if series.dtype.kind in "iu":
+            df[column] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_string_dtype(series) and series.nunique() < len(series) * 0.5:
+            df[column] = series.astype("category")
+    return df
+
+
+def _normalize_columns(columns: pd.Index) -> pd.Index:
+    """Lowercase column names and strip underscores."""
+    return columns.str.replace("_", "", regex=False).str.lower()
+
+
+def _doc_api_date_format(sample: str) -> str:
+    """Pick the date format of a DOC API date column from its first value, so pandas can skip per-value inference."""
+    # The DOC API returns compact timestamps ("20200115T000000Z", or "20200115000000" as in the raw data
+    # files); fall back to ISO 8601 for anything else
+    if len(sample) == 16 and sample[8] == "T":
+        return "%Y%m%dT%H%M%SZ"
+    if len(sample) == 14 and sample.isdigit():
+        return "%Y%m%d%H%M%S"
+    return "ISO8601"
+
+
+def _articles_to_arrow_frame(records: list[dict]) -> pd.DataFrame | None:
+    """Build the articles frame with pyarrow's columnar builder, or None if a field is not a string."""
+    try:
+        table = pa.Table.from_pylist(records, schema=_ARTICLE_SCHEMA)
+    except (TypeError, ValueError):  # pyarrow.ArrowTypeError / ArrowInvalid
+        return None
+    # self_destruct releases each Arrow column once it has been handed to pandas
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
 
 
 def _parse_articles(articles: dict) -> pd.DataFrame:
     """Parse articles response into DataFrame."""
-    if "articles" in articles:
-        return pd.DataFrame(articles["articles"])
-    return pd.DataFrame()
+    if "articles" not in articles:
+        return pd.DataFrame()
+
+    df = _articles_to_arrow_frame(articles["articles"]) if pa is not None else None
+    if df is None:
+        df = pd.DataFrame.from_records(articles["articles"], columns=list(_ARTICLE_COLUMNS))
+        df = df.astype({column: "str" for column in _ARTICLE_COLUMNS if column != "seendate"})
+
+    seendates = df["seendate"].dropna()
+    date_format = _doc_api_date_format(seendates.iloc[0]) if len(seendates) else None
+    df["seendate"] = pd.to_datetime(df["seendate"], format=date_format, cache=True, utc=True)
+    return df
+
+
+def _timeline_values(values: list, dtype: type[np.number]) -> np.ndarray:
+    """Convert the values of a timeline series to an array, with nulls as NaN."""
+    try:
+        return np.fromiter(values, dtype=dtype, count=len(values))
+    except TypeError:
+        # fromiter rejects None; store nulls as NaN in a float column instead, as the DataFrame constructor does
+        return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy()
 
 
 def _parse_timeline(timeline: dict, mode: str | Mode) -> pd.DataFrame:
@@ -51,16 +289,24 @@ def _parse_timeline(timeline: dict, mode: str | Mode) -> pd.DataFrame:
     if (timeline == {}) or (len(timeline["timeline"]) == 0):
         return pd.DataFrame()
 
-    results: dict[str, list] = {"datetime": [entry["date"] for entry in timeline["timeline"][0]["data"]]}
+    first = timeline["timeline"][0]["data"]
+    # Raw volumes are article counts; every other mode reports percentages or tone
+    value_dtype = np.int64 if mode == TimeSeriesMode.VOLUME_RAW else np.float64
+
+    dates = [entry["date"] for entry in first]
+    date_format = _doc_api_date_format(dates[0]) if dates else None
+    results: dict[str, pd.DatetimeIndex | np.ndarray] = {
+        "datetime": pd.to_datetime(dates, format=date_format, cache=True, utc=True),
+    }
 
     for series in timeline["timeline"]:
-        results[series["series"]] = [entry["value"] for entry in series["data"]]
+        values = [entry["value"] for entry in series["data"]]
+        results[series["series"]] = _timeline_values(values, value_dtype)
 
     if mode == TimeSeriesMode.VOLUME_RAW:
-        results["All Articles"] = [entry["norm"] for entry in timeline["timeline"][0]["data"]]
+        results["All Articles"] = _timeline_values([entry["norm"] for entry in first], np.int64)
 
     formatted = pd.DataFrame(results)
-    formatted["datetime"] = pd.to_datetime(formatted["datetime"])
 
     return formatted
 
@@ -102,10 +348,12 @@ class GdeltClient:
     ...     articles = await client.aarticle_search(filters)
     ...     events = await client.asearch("2024-01-15", table=GdeltTable.EVENTS)
 
-    Async usage without context manager:
+    Async usage without context manager; reuse one client so connections stay warm,
+    and close it when done:
 
     >>> articles = await client.aarticle_search(filters)
     >>> events = await client.asearch("2024-01-15", table=GdeltTable.EVENTS)
+    >>> await client.aclose()
     """
 
     GDELT_BASE_URL = "http://data.gdeltproject.org/gdeltv2/"
@@ -122,6 +370,9 @@ class GdeltClient:
         max_retries: int = 5,
         retry_backoff_base: int = 2,
         retry_max_wait: int = 60,
+        parse_processes: int | None = None,
+        cache_dir: str | Path | None = None,
+        optimize_dtypes: bool = False,
     ) -> None:
         """
         Initialize the GDELT client.
@@ -152,10 +403,24 @@ class GdeltClient:
         retry_max_wait
             Maximum wait time in seconds between retries.
             Defaults to 60 seconds.
+        parse_processes
+            Number of worker processes used to parse downloaded data files, so that
+            multi-file searches are parsed on multiple cores. Defaults to None
+            (files are parsed in the downloading thread).
+        cache_dir
+            Optional directory in which downloaded data files are cached. Published GDELT
+            files never change, so cached files are reused by later searches without
+            touching the network. Defaults to None (no caching).
+        optimize_dtypes
+            If True, downcast integer columns of search results to the narrowest dtype
+            that holds their values and store repetitive string columns as categoricals.
+            This reduces memory use, but categorical columns only accept values from their
+            categories and lose the Arrow backing of the pyarrow reader. Defaults to False.
         """
         self.max_depth_json_parsing = json_parsing_max_depth
         self.default_headers: dict[str, str] = {
             "User-Agent": "GDELT Python API client - https://github.com/BobMerkus/gdelt-client",
+            "Accept-Encoding": _ACCEPT_ENCODING,
         }
         self.session = session
         self.aio_session = aio_session
@@ -165,7 +430,12 @@ class GdeltClient:
         self.max_retries = max_retries
         self.retry_backoff_base = retry_backoff_base
         self.retry_max_wait = retry_max_wait
-        self._cameo_codes: pd.DataFrame | None = None
+        self.parse_processes = parse_processes
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
+        self.optimize_dtypes = optimize_dtypes
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_lock = threading.Lock()
+        self._cameo_map: pd.Series | None = None
         # Track if sessions were provided by user (so we don't close them)
         self._user_provided_session = session is not None
         self._user_provided_aio_session = aio_session is not None
@@ -176,8 +446,7 @@ class GdeltClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit sync context manager and cleanup resources."""
-        if not self._user_provided_session and self.session is not None:
-            self.session.close()
+        self.close()
         return False
 
     async def __aenter__(self):
@@ -186,12 +455,64 @@ class GdeltClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context manager and cleanup resources."""
+        await self.aclose()
+        return False
+
+    def close(self) -> None:
+        """
+        Close the requests session and worker processes created by the client.
+
+        Sessions passed to the constructor are left open. The client stays usable and
+        reopens its resources on the next request.
+        """
+        if not self._user_provided_session and self.session is not None:
+            self.session.close()
+            self.session = None
+        self._shutdown_process_pool()
+
+    async def aclose(self) -> None:
+        """
+        Close the aiohttp session and worker processes created by the client.
+
+        Async counterpart of :meth:`close`, for clients used without ``async with``.
+        """
         if not self._user_provided_aio_session and self.aio_session is not None:
             await self.aio_session.close()
-        return False
+            self.aio_session = None
+        self._shutdown_process_pool()
+
+    @staticmethod
+    def install_fast_loop() -> None:
+        """
+        Opt in to a faster asyncio event loop for the async interface.
+
+        Installs the uvloop event loop policy, or the io_uring based uringcore policy
+        when uvloop is not available. Call this once before starting the event loop,
+        e.g. before ``asyncio.run()``.
+
+        Raises
+        ------
+        ImportError
+            If neither uvloop nor uringcore is installed.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            try:
+                import uringcore
+            except ImportError as e:
+                raise ImportError(
+                    "uvloop or uringcore is required for the fast event loop. Install with: pip install uvloop"
+                ) from e
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     def _get_retry_kwargs(self, wait=None) -> dict:
         """Get retry configuration kwargs for tenacity."""
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+
         if self.max_retries == 0:
             return {}
 
@@ -204,6 +525,8 @@ class GdeltClient:
 
     def _get_async_retry_kwargs(self, wait=None) -> dict:
         """Get retry configuration kwargs for tenacity (async version with aiohttp errors)."""
+        from aiohttp import ClientConnectionError
+
         if self.max_retries == 0:
             return {}
 
@@ -216,6 +539,8 @@ class GdeltClient:
 
     def _retry_with_logging(self, func, *args, **kwargs):
         """Execute function with retry logic and logging (sync)."""
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+
         retry_kwargs = self._get_retry_kwargs()
         if not retry_kwargs:
             return func(*args, **kwargs)
@@ -236,6 +561,8 @@ class GdeltClient:
 
     async def _aretry_with_logging(self, func, *args, **kwargs):
         """Execute async function with retry logic and logging."""
+        from aiohttp import ClientConnectionError
+
         retry_kwargs = self._get_async_retry_kwargs()
         if not retry_kwargs:
             return await func(*args, **kwargs)
@@ -254,12 +581,64 @@ class GdeltClient:
                         )
                     raise
 
+    def _get_session(self) -> Session:
+        """Lazily create the requests session, sized to the download thread pool."""
+        if self.session is None:
+            from requests import Session
+            from requests.adapters import HTTPAdapter
+
+            # Match ThreadPoolExecutor's default so download threads don't wait on pooled connections
+            pool_size = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session = Session()
+            self.session.headers.update(self.default_headers)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        return self.session
+
+    def _get_aio_session(self) -> ClientSession:
+        """Lazily create the aiohttp session, with a connector sized to the download concurrency."""
+        if self.aio_session is None:
+            from aiohttp import ClientSession, TCPConnector
+
+            # Without a matching limit the connector queues requests the semaphore already let through
+            limit = self.max_concurrent_downloads
+            # Keep idle connections around between sequential queries to skip repeated TLS handshakes
+            connector = TCPConnector(limit=limit, limit_per_host=limit, keepalive_timeout=75)
+            self.aio_session = ClientSession(connector=connector, headers=self.default_headers, auto_decompress=True)
+        return self.aio_session
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the process pool used for parsing data files."""
+        # Download threads ask for the pool at once, so create it under a lock to start only one
+        if self._process_pool is None:
+            with self._process_pool_lock:
+                if self._process_pool is None:
+                    # Spawn rather than fork: the client runs download threads and event loops that must not be forked
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.parse_processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._process_pool
+
+    def _shutdown_process_pool(self) -> None:
+        """Shut down the parsing process pool, if one was started."""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown()
+
     @property
     def cameo_codes(self) -> pd.DataFrame:
-        """Lazy-load CAMEO codes lookup table."""
-        if self._cameo_codes is None:
-            self._cameo_codes = load_cameo_codes()
-        return self._cameo_codes
+        """CAMEO codes lookup table."""
+        return load_cameo_codes()
+
+    @property
+    def cameo_map(self) -> pd.Series:
+        """Lazy-build CAMEO code to description mapping, keyed by code string."""
+        if self._cameo_map is None:
+            self._cameo_map = self.cameo_codes["Description"].astype(str)
+        return self._cameo_map
 
     def article_search(self, filters: Filters) -> pd.DataFrame:
         """
@@ -303,13 +682,9 @@ class GdeltClient:
         """Execute a DOC API query (sync)."""
 
         def _do_query():
-            if self.session is None:
-                self.session = Session()
-                self.session.headers.update(self.default_headers)
+            session = self._get_session()
 
-            response = self.session.get(
-                f"{self.DOC_API_URL}?query={query_string}&mode={mode}&format=json",
-            )
+            response = session.get(self._build_query_url(mode, query_string))
 
             raise_response_error(response=response)
 
@@ -330,14 +705,76 @@ class GdeltClient:
         timeline = await self._aquery(mode, filters.query_string)
         return _parse_timeline(timeline, mode)
 
+    async def abatch_article_search(
+        self,
+        filters_list: list[Filters],
+        max_concurrency: int = 16,
+    ) -> list[pd.DataFrame | BaseException]:
+        """
+        Run several article searches concurrently.
+
+        Parameters
+        ----------
+        filters_list
+            Filters objects, one per search.
+        max_concurrency
+            Maximum number of DOC API requests in flight at once.
+
+        Returns
+        -------
+        list[pd.DataFrame | BaseException]
+            One result per filters object, in the same order. A search that failed
+            (after retries) is returned as its exception instead of raising.
+        """
+        return await self._abatch(self.aarticle_search, filters_list, max_concurrency)
+
+    async def abatch_timeline_search(
+        self,
+        mode: str | TimeSeriesMode,
+        filters_list: list[Filters],
+        max_concurrency: int = 16,
+    ) -> list[pd.DataFrame | BaseException]:
+        """
+        Run several timeline searches concurrently.
+
+        Parameters
+        ----------
+        mode
+            Timeline mode, see timeline_search().
+        filters_list
+            Filters objects, one per search.
+        max_concurrency
+            Maximum number of DOC API requests in flight at once.
+
+        Returns
+        -------
+        list[pd.DataFrame | BaseException]
+            One result per filters object, in the same order. A search that failed
+            (after retries) is returned as its exception instead of raising.
+        """
+        return await self._abatch(partial(self.atimeline_search, mode), filters_list, max_concurrency)
+
+    async def _abatch(
+        self,
+        search_fn: Callable[[Filters], Awaitable[pd.DataFrame]],
+        filters_list: list[Filters],
+        max_concurrency: int,
+    ) -> list[pd.DataFrame | BaseException]:
+        """Fan searches out with asyncio.gather, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _search_with_semaphore(filters: Filters) -> pd.DataFrame:
+            async with semaphore:
+                return await search_fn(filters)
+
+        return await asyncio.gather(*(_search_with_semaphore(f) for f in filters_list), return_exceptions=True)
+
     async def _aquery(self, mode: str | Mode, query_string: str) -> dict:
         """Execute a DOC API query (async)."""
 
         async def _do_aquery():
-            if self.aio_session is None:
-                self.aio_session = ClientSession(headers=self.default_headers)
-
-            response = await self.aio_session.get(f"{self.DOC_API_URL}?query={query_string}&mode={mode}&format=json")
+            session = self._get_aio_session()
+            response = await session.get(self._build_query_url(mode, query_string))
 
             raise_response_error(response=response)
 
@@ -419,6 +856,8 @@ class GdeltClient:
                 raise ValueError("No data returned for the specified date(s).")
 
             results = pd.concat(valid_dfs, ignore_index=True)
+            # Release the per-file frames before the CAMEO merge and output formatting make further copies
+            del dfs, valid_dfs
 
         if results is None or results.empty:
             raise ValueError("No data returned for the specified date(s).")
@@ -426,6 +865,9 @@ class GdeltClient:
         if table_enum == GdeltTable.EVENTS:
             results = self._add_cameo_descriptions(results)
 
+        if self.optimize_dtypes:
+            results = _optimize_dtypes(results)
+
         return self._format_output(results, output_enum, normalize_columns)
 
     async def asearch(
@@ -465,6 +907,8 @@ class GdeltClient:
                 raise ValueError("No data returned for the specified date(s).")
 
             results = pd.concat(valid_dfs, ignore_index=True)
+            # Release the per-file frames before the CAMEO merge and output formatting make further copies
+            del dfs, valid_dfs
 
         if results is None or results.empty:
             raise ValueError("No data returned for the specified date(s).")
@@ -472,6 +916,9 @@ class GdeltClient:
         if table_enum == GdeltTable.EVENTS:
             results = self._add_cameo_descriptions(results)
 
+        if self.optimize_dtypes:
+            results = _optimize_dtypes(results)
+
         return self._format_output(results, output_enum, normalize_columns)
 
     def schema(self, table: GdeltTable | str) -> pd.DataFrame:
@@ -488,26 +935,20 @@ class GdeltClient:
         pd.DataFrame
             DataFrame with column information (name, type, description).
         """
-        import json
-
-        from gdelt_client.helpers import SCHEMA_DIR
-
         table_str = table.value if isinstance(table, GdeltTable) else table
-        schema_files = {
-            "events": "eventsv2.json",
-            "mentions": "mentions.json",
-            "gkg": "gkgv2.json",
-        }
-
-        if table_str not in schema_files:
-            raise ValueError(f"Unknown table: {table_str}")
-
-        schema_path = SCHEMA_DIR / schema_files[table_str]
-        with schema_path.open() as f:
-            schema_data = json.load(f)
-
-        fields = schema_data["schema"]["fields"]
-        return pd.DataFrame(fields)
+        return pd.DataFrame(list(load_schema_fields(table_str)))
+
+    def _build_query_url(self, mode: str | Mode, query_string: str) -> str:
+        """Build a percent-encoded DOC API URL from a Filters query string."""
+        # Filters.query_string is the query text followed by "&name=value" parameters
+        query, _, rest = query_string.partition("&")
+        params = {"query": query}
+        for param in rest.split("&") if rest else []:
+            name, _, value = param.partition("=")
+            params[name] = value
+        params["mode"] = str(mode)
+        params["format"] = "json"
+        return f"{self.DOC_API_URL}?{urlencode(params, quote_via=quote)}"
 
     def _build_urls(
         self,
@@ -525,6 +966,48 @@ class GdeltClient:
         suffix = suffixes[table]
         return [f"{self.GDELT_BASE_URL}{date_str}{suffix}" for date_str in date_strings]
 
+    def _cache_path(self, url: str) -> Path | None:
+        """Path of the cached copy of a data file, keyed by the file name in the URL."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / url.rsplit("/", 1)[-1]
+
+    def _read_cache(self, url: str) -> bytes | None:
+        """Read a data file from the cache, if cached and readable."""
+        path = self._cache_path(url)
+        if path is None or not path.is_file():
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning("Could not read cached file %s: %s", path, e)
+            return None
+
+    def _write_cache(self, url: str, content: bytes) -> None:
+        """Write a downloaded data file to the cache; failures are logged, as the download itself succeeded."""
+        path = self._cache_path(url)
+        if path is None:
+            return
+        # Write then rename so concurrent searches never read a partially written file
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Could not cache %s at %s: %s", url, path, e)
+            with suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+    def _discard_cache(self, url: str) -> None:
+        """Remove a cached data file that could not be parsed, so it is downloaded again."""
+        path = self._cache_path(url)
+        if path is None:
+            return
+        logger.warning("Discarding unreadable cached file %s", path)
+        with suppress(OSError):
+            path.unlink(missing_ok=True)
+
     def _download_and_parse(
         self,
         url: str,
@@ -534,11 +1017,17 @@ class GdeltClient:
         """Download and parse a single GDELT data file (sync)."""
 
         def _do_download():
-            if self.session is None:
-                self.session = Session()
-                self.session.headers.update(self.default_headers)
+            cached = self._read_cache(url)
+            if cached is not None:
+                try:
+                    return self._parse_gdelt_file(cached, table, columns)
+                except Exception:
+                    # A truncated or corrupt copy would fail on every later search; fetch the file again instead
+                    self._discard_cache(url)
+
+            session = self._get_session()
 
-            response = self.session.get(url, timeout=self.download_timeout)
+            response = session.get(url, timeout=self.download_timeout)
 
             if response.status_code == 404:
                 warnings.warn(f"No data available for URL: {url}", stacklevel=2)
@@ -547,6 +1036,7 @@ class GdeltClient:
             # This will raise RateLimitError or ServerError which will trigger retries
             raise_response_error(response=response)
             response.raise_for_status()
+            self._write_cache(url, response.content)
             return self._parse_gdelt_file(response.content, table, columns)
 
         try:
@@ -569,10 +1059,17 @@ class GdeltClient:
         """Download and parse a single GDELT data file (async)."""
 
         async def _do_adownload():
-            if self.aio_session is None:
-                self.aio_session = ClientSession(headers=self.default_headers)
+            cached = await asyncio.to_thread(self._read_cache, url)
+            if cached is not None:
+                try:
+                    return await asyncio.to_thread(self._parse_gdelt_file, cached, table, columns)
+                except Exception:
+                    # A truncated or corrupt copy would fail on every later search; fetch the file again instead
+                    await asyncio.to_thread(self._discard_cache, url)
+
+            from aiohttp import ClientTimeout
 
-            async with self.aio_session.get(url, timeout=ClientTimeout(total=self.download_timeout)) as response:
+            async with self._get_aio_session().get(url, timeout=ClientTimeout(total=self.download_timeout)) as response:
                 if response.status == 404:
                     warnings.warn(f"No data available for URL: {url}", stacklevel=2)
                     return None
@@ -581,7 +1078,8 @@ class GdeltClient:
                 raise_response_error(response=response)
                 response.raise_for_status()
                 content = await response.read()
-                return self._parse_gdelt_file(content, table, columns)
+                await asyncio.to_thread(self._write_cache, url, content)
+                return await asyncio.to_thread(self._parse_gdelt_file, content, table, columns)
 
         try:
             return await self._aretry_with_logging(_do_adownload)
@@ -611,23 +1109,11 @@ class GdeltClient:
         table: GdeltTable,
         columns: list[str],
     ) -> pd.DataFrame:
-        """Parse compressed GDELT CSV/TSV data."""
-        buffer = BytesIO(data)
-
-        dtype_overrides: dict[int, str] = {}
-        if table == GdeltTable.EVENTS:
-            dtype_overrides = {26: "str", 27: "str", 28: "str"}
-
-        df = pd.read_csv(  # type: ignore[call-overload]
-            buffer,
-            compression="zip",
-            sep="\t",
-            header=None,
-            on_bad_lines="skip",
-            dtype=dtype_overrides,  # type: ignore[arg-type]
-            low_memory=False,
-            encoding="latin-1",
-        )
+        """Parse compressed GDELT CSV/TSV data, in a worker process if `parse_processes` is set."""
+        if self.parse_processes:
+            df = self._get_process_pool().submit(_read_gdelt_file, data, table).result()
+        else:
+            df = _read_gdelt_file(data, table)
 
         if len(df.columns) == len(columns):
             df.columns = pd.Index(columns)
@@ -639,7 +1125,6 @@ class GdeltClient:
                 stacklevel=2,
             )
 
-        buffer.close()
         return df
 
     def _add_cameo_descriptions(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -647,13 +1132,17 @@ class GdeltClient:
         if "EventCode" not in df.columns:
             return df
 
-        codes_df = self.cameo_codes
-        descriptions = df["EventCode"].apply(lambda x: get_cameo_description(str(x), codes_df))
+        # astype(str) leaves nulls as NaN under pandas' string dtype; spell them out as str() would, so missing codes
+        # still get the fallback description rather than a null
+        codes = df["EventCode"].astype(str).fillna("nan")
+        descriptions = codes.map(self.cameo_map).fillna("No description for CAMEO code " + codes)
 
-        insert_idx = df.columns.get_loc("EventCode") + 1  # type: ignore[operator]
-        df.insert(insert_idx, "CAMEOCodeDescription", descriptions)  # type: ignore[arg-type]
+        cols = df.columns.tolist()
+        insert_idx = cols.index("EventCode") + 1
+        df["CAMEOCodeDescription"] = descriptions
 
-        return df
+        # Appending and reordering once avoids the block manager reshuffle of DataFrame.insert
+        return df.reindex(columns=[*cols[:insert_idx], "CAMEOCodeDescription", *cols[insert_idx:]])
 
     def _format_output(
         self,
@@ -663,7 +1152,7 @@ class GdeltClient:
     ) -> pd.DataFrame | str | dict | gpd.GeoDataFrame:
         """Format the output based on the requested format."""
         if normalize_columns:
-            df.columns = pd.Index([col.replace("_", "").lower() for col in df.columns])
+            df.columns = _normalize_columns(df.columns)
 
         match output:
             case OutputFormat.DATAFRAME:
@@ -681,7 +1170,7 @@ class GdeltClient:
         """Convert DataFrame to GeoDataFrame with geometry column."""
         try:
             import geopandas as gpd_module
-            from shapely.geometry import Point
+            import shapely
         except ImportError as e:
             raise ImportError(
                 "geopandas and shapely are required for GeoDataFrame output. "
@@ -697,11 +1186,14 @@ class GdeltClient:
                 "for GeoDataFrame conversion."
             )
 
-        filtered = df[df[lat_col].notna() & df[lon_col].notna()].copy()
+        lat = df[lat_col].to_numpy(dtype="float64", na_value=np.nan)
+        lon = df[lon_col].to_numpy(dtype="float64", na_value=np.nan)
+        mask = np.isfinite(lat) & np.isfinite(lon)
 
-        geometry = [Point(lon, lat) for lon, lat in zip(filtered[lon_col], filtered[lat_col], strict=False)]
+        # Boolean indexing already returns a new frame, and the points are built in a single vectorized call
+        geometry = shapely.points(lon[mask], lat[mask])
 
-        gdf = gpd_module.GeoDataFrame(filtered, geometry=geometry, crs="EPSG:4326")
-        gdf.columns = pd.Index([col.replace("_", "").lower() for col in gdf.columns])
+        gdf = gpd_module.GeoDataFrame(df[mask], geometry=geometry, crs="EPSG:4326")
+        gdf.columns = _normalize_columns(gdf.columns)
 
-        return gdf[gdf.geometry.notna()]
+        return gdf
@@ -30,6 +30,9 @@ class GdeltTable(StrEnum):
     GKG = "gkg"
 
 
+VALID_TABLES: frozenset[str] = frozenset(GdeltTable)
+
+
 class OutputFormat(StrEnum):
     DATAFRAME = "df"
     JSON = "json"
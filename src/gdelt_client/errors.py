@@ -1,15 +1,27 @@
-from aiohttp import ClientResponse
-from requests import Response
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from gdelt_client.enums import HttpResponseCodes
 
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from requests import Response
+
+
+def _status_code(response: Response | ClientResponse) -> int:
+    # Imported here so that importing the package does not load requests
+    from requests import Response
+
+    return response.status_code if isinstance(response, Response) else response.status
+
 
 class GdeltAPIError(Exception):
     """Base exception for GDELT API errors"""
 
     def __init__(self, response: Response | ClientResponse):
         self.response = response
-        status_code = response.status_code if isinstance(response, Response) else response.status
+        status_code = _status_code(response)
         super().__init__(f"HTTP {status_code}: {response.reason}")
 
 
@@ -34,7 +46,7 @@ class ServerError(GdeltAPIError):
 
 
 def raise_response_error(response: Response | ClientResponse) -> None:
-    status_code = response.status_code if isinstance(response, Response) else response.status
+    status_code = _status_code(response)
     if status_code == HttpResponseCodes.OK.value:
         return
 
@@ -1,4 +1,4 @@
-from string import ascii_lowercase, digits
+from string import ascii_lowercase
 
 from gdelt_client.helpers import Date, format_date
 from gdelt_client.validation import validate_tone
@@ -7,6 +7,7 @@ Filter = list[str] | str
 
 
 VALID_TIMESPAN_UNITS = ["min", "h", "hours", "d", "days", "w", "weeks", "m", "months"]
+_TIMESPAN_UNITS = frozenset(VALID_TIMESPAN_UNITS)
 
 
 def near(n: int, *args) -> str:
@@ -338,13 +339,14 @@ class Filters:
         value = timespan.rstrip(ascii_lowercase)
         unit = timespan[len(value) :]
 
-        if unit not in VALID_TIMESPAN_UNITS:
+        if unit not in _TIMESPAN_UNITS:
             raise ValueError(
                 f"Timespan {timespan} is invalid. {unit} is not a supported unit, \
                 must be one of {' '.join(VALID_TIMESPAN_UNITS)}"
             )
 
-        if not all(d in digits for d in value):
+        # isdigit() alone also accepts non-ASCII digits such as superscripts
+        if not (value.isascii() and value.isdigit()):
             raise ValueError(f"Timespan {timespan} is invalid. {value} could not be converted into an integer")
 
         if unit == "min" and int(value) < 60:
@@ -1,10 +1,15 @@
+import re
 from datetime import datetime
 
-from gdelt_client.enums import GdeltTable
+import pandas as pd
+
+from gdelt_client.enums import VALID_TABLES, GdeltTable
 from gdelt_client.helpers import GDELT_V2_START, parse_date
 
 Filter = list[str] | str
 
+_TONE_RE = re.compile(r"[<>]-?\d+(?:\.\d+)?")
+
 
 def validate_tone(tone: Filter) -> None:
     """
@@ -18,18 +23,22 @@ def validate_tone(tone: Filter) -> None:
     Raises
     ------
     ValueError
-        If tone doesn't contain < or >, or contains =.
-    NotImplementedError
-        If multiple tones are provided.
+        If tone is not a single < or > comparator followed by a number, or if
+        multiple tones are provided.
+    TypeError
+        If tone is neither a string nor a list.
     """
-    if not ("<" in tone or ">" in tone):
-        raise ValueError("Tone must contain either greater than or less than")
-
-    if "=" in tone:
-        raise ValueError("Tone cannot contain '='")
-
-    if isinstance(tone, list):
-        raise NotImplementedError("Multiple tones are not supported yet")
+    match tone:
+        case list():
+            raise ValueError("Multiple tones are not supported yet")
+        case str() if not _TONE_RE.fullmatch(tone):
+            raise ValueError(
+                f"Invalid tone filter {tone!r}: must be '<' or '>' followed by a number, e.g. '>5' or '<-2.5'"
+            )
+        case str():
+            return
+        case _:
+            raise TypeError(f"Unsupported tone type: {type(tone)}")
 
 
 def validate_date(date: str | datetime | list[str | datetime]) -> None:
@@ -46,29 +55,49 @@ def validate_date(date: str | datetime | list[str | datetime]) -> None:
     ValueError
         If any date is in the future or before GDELT 2.0 start date.
     """
-    now = datetime.now()
-
     if isinstance(date, str | datetime):
-        dates = [parse_date(date)]
+        # A single date needs no vectorization; parse_date's ISO fast path is much cheaper than pd.to_datetime
+        dates: pd.DatetimeIndex | list[datetime] = [parse_date(date)]
+        _check_date_bounds(dates[0])
     elif isinstance(date, list):
-        dates = [parse_date(d) for d in date]
+        try:
+            parsed: pd.DatetimeIndex | None = pd.DatetimeIndex(pd.to_datetime(tuple(date), format="ISO8601"))
+        except (ValueError, TypeError):
+            parsed = None
+        if parsed is None or parsed.hasnans:
+            # Non-ISO or mixed formats defeat vectorized parsing, dates outside pandas' range (which raise
+            # OutOfBoundsDatetime) cannot be represented at all, and None/""/"NaT" silently become NaT; check
+            # each date on its own instead, which also reports unparseable dates
+            dates = [parse_date(d) for d in date]
+            for dt in dates:
+                _check_date_bounds(dt)
+        else:
+            dates = parsed
+            future = dates > pd.Timestamp.now(tz=dates.tz)
+            if future.any():
+                _check_date_bounds(dates[future][0])
+            too_early = dates < pd.Timestamp(GDELT_V2_START, tz=dates.tz)
+            if too_early.any():
+                _check_date_bounds(dates[too_early][0])
     else:
         raise ValueError(f"Unsupported date type: {type(date)}")
 
-    for dt in dates:
-        if dt > now:
-            raise ValueError(f"Date {dt} is in the future. Please enter a valid date.")
-
-        if dt < GDELT_V2_START:
-            raise ValueError(
-                f"Date {dt} is before GDELT 2.0 start date ({GDELT_V2_START.date()}). "
-                "GDELT 2.0 only supports dates from Feb 18, 2015 onwards."
-            )
-
     if len(dates) == 2 and dates[0] >= dates[1]:
         raise ValueError(f"Start date ({dates[0]}) must be before end date ({dates[1]}).")
 
 
+def _check_date_bounds(dt: datetime) -> None:
+    """Raise if a date lies in the future or before GDELT 2.0; aware dates are compared in their own time zone."""
+    if dt > datetime.now(dt.tzinfo):
+        raise ValueError(f"Date {dt} is in the future. Please enter a valid date.")
+
+    if dt < GDELT_V2_START.replace(tzinfo=dt.tzinfo):
+        raise ValueError(
+            f"Date {dt} is before GDELT 2.0 start date ({GDELT_V2_START.date()}). "
+            "GDELT 2.0 only supports dates from Feb 18, 2015 onwards."
+        )
+
+
 def validate_table(table: GdeltTable | str, translation: bool = False) -> None:
     """
     Validate table configuration for GDELT 2.0.
@@ -85,8 +114,5 @@ def validate_table(table: GdeltTable | str, translation: bool = False) -> None:
     ValueError
         If table name is not valid.
     """
-    valid_tables = {t.value for t in GdeltTable}
-    table_str = table.value if isinstance(table, GdeltTable) else table
-
-    if table_str not in valid_tables:
-        raise ValueError(f"Invalid table '{table_str}'. Must be one of: {', '.join(valid_tables)}")
+    if table not in VALID_TABLES:
+        raise ValueError(f"Invalid table '{table}'. Must be one of: {', '.join(GdeltTable)}")
@@ -0,0 +1,207 @@
+import json
+from contextlib import nullcontext
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, TCPConnector
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+
+from gdelt_client import Filters, GdeltClient
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aio_session():
+    """
+    Share one aiohttp session across the integration tests so connections to the GDELT API are reused.
+
+    Tests using this fixture must run on the session event loop, i.e. be marked with
+    ``@pytest.mark.asyncio(loop_scope="session")``.
+    """
+    # Each pytest-xdist worker gets its own session, so keep the per-host cap low enough that parallel workers
+    # together stay below GDELT's rate limits
+    connector = TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60)
+    async with ClientSession(connector=connector, headers=GdeltClient().default_headers) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Sync counterpart of ``aio_session``: one requests session, capped at the same number of connections."""
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    with Session() as session:
+        session.headers.update(GdeltClient().default_headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        yield session
+
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+# Dates the cassettes were recorded for; the DOC API only serves a rolling three months, so the dates can only be
+# pinned for replay and are refreshed whenever the cassettes are re-recorded
+SEARCH_WINDOW_FILE = CASSETTE_DIR / "search_window.json"
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """
+    Replay recorded GDELT API responses for the integration tests.
+
+    See ``record_mode`` for when requests are recorded instead.
+    """
+    return {
+        "match_on": ["method", "scheme", "host", "path", "query"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir() -> str:
+    return str(CASSETTE_DIR)
+
+
+def _has_cassettes() -> bool:
+    return any(CASSETTE_DIR.glob("*.yaml"))
+
+
+def _record_mode(config: pytest.Config) -> str | None:
+    """pytest-recording's record mode, or None when the plugin is not installed or disabled."""
+    if not config.pluginmanager.hasplugin("recording") or config.getoption("--disable-recording"):
+        return None
+    record_mode = config.getoption("--record-mode") or "none"
+    # Until cassettes have been recorded and committed there is nothing to replay, so record them rather than
+    # failing every integration test
+    if record_mode == "none" and not _has_cassettes():
+        return "once"
+    return record_mode
+
+
+@pytest.fixture(scope="session")
+def record_mode(pytestconfig: pytest.Config) -> str:
+    """
+    Record mode of the ``vcr`` marks.
+
+    Committed cassettes are replayed as-is, so a missing or outdated cassette fails the test instead of falling
+    through to the live API; pass ``--record-mode=once`` to add missing cassettes or ``rewrite`` to re-record
+    all of them. Without any committed cassettes, missing ones are recorded.
+    """
+    return _record_mode(pytestconfig) or "none"
+
+
+@pytest.fixture(scope="module")
+def module_cassette(request: pytest.FixtureRequest, vcr_config: dict, vcr_cassette_dir: str):
+    """
+    Open a named cassette around API calls made by module-scoped fixtures.
+
+    Those fixtures run before the ``vcr`` mark of any test installs its own cassette, so they need their own.
+    """
+    record_mode = _record_mode(request.config)
+    if record_mode is None:
+        return lambda name: nullcontext()
+
+    import vcr
+
+    def cassette(name: str):
+        path = Path(vcr_cassette_dir) / f"{request.module.__name__}.{name}.yaml"
+        # "rewrite" is pytest-recording's own mode: drop the old cassette and record it again
+        if record_mode == "rewrite":
+            path.unlink(missing_ok=True)
+        mode = "new_episodes" if record_mode == "rewrite" else record_mode
+        return vcr.VCR(record_mode=mode, **vcr_config).use_cassette(str(path))
+
+    return cassette
+
+
+@pytest.fixture(scope="session")
+def search_window(pytestconfig: pytest.Config) -> tuple[str, str]:
+    """
+    One-day search window for the integration tests.
+
+    Cassettes are replayed with the dates they were recorded for, so their query URLs keep matching. Live
+    runs, and recordings that start afresh (including while no cassettes are committed), use Monday of last
+    week instead, which stays inside the DOC API's rolling three month range.
+    """
+    record_mode = _record_mode(pytestconfig)
+    refresh = record_mode in ("rewrite", "all") or not SEARCH_WINDOW_FILE.exists() or not _has_cassettes()
+    if record_mode is not None and not refresh:
+        start_date, end_date = json.loads(SEARCH_WINDOW_FILE.read_text())
+        return start_date, end_date
+
+    monday = date.today() - timedelta(days=date.today().weekday() + 7)
+    window = monday.isoformat(), (monday + timedelta(days=1)).isoformat()
+    if record_mode not in (None, "none"):
+        CASSETTE_DIR.mkdir(exist_ok=True)
+        SEARCH_WINDOW_FILE.write_text(json.dumps(window) + "\n")
+    return window
+
+
+@pytest.fixture
+def default_filter(search_window: tuple[str, str]) -> Filters:
+    start_date, end_date = search_window
+    return Filters(keyword="environment", start_date=start_date, end_date=end_date)
+
+
+@pytest.fixture(scope="module")
+def client() -> GdeltClient:
+    return GdeltClient()
+
+
+@pytest.fixture(scope="module")
+def events_schema(client: GdeltClient) -> pd.DataFrame:
+    return client.schema("events")
+
+
+@pytest.fixture
+def patched_client():
+    """
+    Client whose file downloads are mocked out to return a small events frame.
+
+    Adjust ``_download_and_parse`` / ``_adownload_and_parse`` on the returned client to change the mocked data.
+    """
+    client = GdeltClient()
+    mock_df = pd.DataFrame({"GLOBALEVENTID": [1, 2], "EventCode": ["01", "02"]})
+
+    with (
+        mock.patch.object(client, "_download_and_parse", return_value=mock_df),
+        mock.patch.object(client, "_adownload_and_parse", new_callable=mock.AsyncMock, return_value=mock_df),
+    ):
+        yield client
+
+
+class _StubHTTP:
+    """Canned response for requests' HTTPAdapter; records every request that reaches the adapter."""
+
+    def __init__(self) -> None:
+        self.calls: list[PreparedRequest] = []
+        self.respond(b'{"test": "data"}')
+
+    def respond(self, body: bytes, status: int = 200, content_type: str = "application/json") -> None:
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+
+    def send(self, adapter: HTTPAdapter, request: PreparedRequest, **kwargs) -> Response:
+        self.calls.append(request)
+        response = Response()
+        response.status_code = self.status
+        response.headers["Content-Type"] = self.content_type
+        response._content = self.body
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def stub_http():
+    """
+    Stub the HTTP layer of ``requests`` so real sessions can be exercised without network access.
+
+    Sessions, header handling and URL preparation run as normal; only ``HTTPAdapter.send`` is replaced.
+    """
+    stub = _StubHTTP()
+    with mock.patch.object(HTTPAdapter, "send", autospec=True, side_effect=stub.send):
+        yield stub
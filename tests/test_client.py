@@ -1,41 +1,67 @@
+import asyncio
+import io
+import zipfile
 from datetime import datetime, timedelta
+from functools import cache
 from unittest import mock
 
 import pandas as pd
 import pytest
+import pytest_asyncio
 from aiohttp import ClientSession
 from requests import Response
 
 from gdelt_client import Filters, GdeltClient
+from gdelt_client.enums import GdeltTable
 from gdelt_client.errors import RateLimitError
 
+TIMELINE_MODES = ["timelinevol", "timelinevolraw", "timelinelang", "timelinetone", "timelinesourcecountry"]
+# Shared by the tests that mock out the DOC API query; Filters is only read by the client, never modified
+MOCKED_FILTER = Filters(keyword="environment", timespan="1h")
 
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def timeline_results(aio_session, search_window, module_cassette):
+    """Fetch every timeline mode once (concurrently) and share the frames across the async shape tests."""
+    start_date, end_date = search_window
+    f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
+
+    with module_cassette("timeline_results"):
+        async with GdeltClient(aio_session=aio_session) as gd:
+            results = await asyncio.gather(*(gd.atimeline_search(mode, f) for mode in TIMELINE_MODES))
+
+    return dict(zip(TIMELINE_MODES, results, strict=True))
+
+
+@pytest.fixture(scope="module")
+def sync_timeline_results(http_session, search_window, module_cassette):
+    """Fetch every timeline mode once with the sync client and share the frames across the sync shape tests."""
+    start_date, end_date = search_window
+    f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
+
+    with module_cassette("sync_timeline_results"), GdeltClient(session=http_session) as gd:
+        return {mode: gd.timeline_search(mode, f) for mode in TIMELINE_MODES}
+
+
+@pytest.mark.vcr
 class TestArticleSearchAsync:
     """
     Test that the API client behaves correctly when doing an article search query
     """
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_articles_is_a_df(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        async with GdeltClient() as client:
-            articles = await client.aarticle_search(f)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_articles_is_a_df(self, aio_session, default_filter):
+        async with GdeltClient(aio_session=aio_session) as client:
+            articles = await client.aarticle_search(default_filter)
 
         assert type(articles) is pd.DataFrame
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_correct_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        async with GdeltClient() as client:
-            articles = await client.aarticle_search(f)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_correct_columns(self, aio_session, default_filter):
+        async with GdeltClient(aio_session=aio_session) as client:
+            articles = await client.aarticle_search(default_filter)
 
         assert list(articles.columns) == [
             "url",
@@ -49,128 +75,104 @@ class TestArticleSearchAsync:
         ]
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_rows_returned(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rows_returned(self, aio_session, default_filter):
         # This test could fail if there really are no articles
         # that match the filter, but given the query used for
         # testing that's very unlikely.
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        async with GdeltClient() as client:
-            articles = await client.aarticle_search(f)
+        async with GdeltClient(aio_session=aio_session) as client:
+            articles = await client.aarticle_search(default_filter)
 
         assert articles.shape[0] >= 1
 
 
+@pytest.mark.vcr
 class TestTimelineSearchAsync:
     """
     Test that the various modes of timeline search behave correctly.
     """
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_all_modes_return_a_df(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-
-        async with GdeltClient() as gd:
-            all_results = []
-            for mode in [
-                "timelinevol",
-                "timelinevolraw",
-                "timelinelang",
-                "timelinetone",
-                "timelinesourcecountry",
-            ]:
-                result = await gd.atimeline_search(mode, f)
-                all_results.append(result)
-
-        assert all(type(result) is pd.DataFrame for result in all_results)
+    @pytest.mark.parametrize("mode", TIMELINE_MODES)
+    def test_all_modes_return_a_df(self, mode, timeline_results):
+        assert type(timeline_results[mode]) is pd.DataFrame
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_all_modes_return_data(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-
-        async with GdeltClient() as gd:
-            all_results = []
-            for mode in [
-                "timelinevol",
-                "timelinevolraw",
-                "timelinelang",
-                "timelinetone",
-                "timelinesourcecountry",
-            ]:
-                result = await gd.atimeline_search(mode, f)
-                all_results.append(result)
-
-        assert all(result.shape[0] >= 1 for result in all_results)
+    @pytest.mark.parametrize("mode", TIMELINE_MODES)
+    def test_all_modes_return_data(self, mode, timeline_results):
+        assert timeline_results[mode].shape[0] >= 1
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_unsupported_mode(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_unsupported_mode(self, aio_session, default_filter):
         with pytest.raises(ValueError, match="Invalid"):
-            async with GdeltClient() as gd:
-                await gd.atimeline_search(
-                    "unsupported",
-                    Filters(
-                        keyword="environment",
-                        start_date=start_date,
-                        end_date=end_date,
-                    ),
-                )
+            async with GdeltClient(aio_session=aio_session) as gd:
+                await gd.atimeline_search("unsupported", default_filter)
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_vol_has_two_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-
-        async with GdeltClient() as gd:
-            result = await gd.atimeline_search("timelinevol", f)
-
-        assert result.shape[1] == 2
+    def test_vol_has_two_columns(self, timeline_results):
+        assert timeline_results["timelinevol"].shape[1] == 2
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_vol_raw_has_three_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-
-        async with GdeltClient() as gd:
-            result = await gd.atimeline_search("timelinevolraw", f)
-
-        assert result.shape[1] == 3
+    def test_vol_raw_has_three_columns(self, timeline_results):
+        assert timeline_results["timelinevolraw"].shape[1] == 3
 
     @pytest.mark.asyncio
     async def test_handles_empty_API_response(self):
         async with GdeltClient() as gd:
             with mock.patch.object(gd, "_aquery", new_callable=mock.AsyncMock) as query_mock:
                 query_mock.return_value = {}
-                result = await gd.atimeline_search("timelinetone", Filters(keyword="environment", timespan="1h"))
+                result = await gd.atimeline_search("timelinetone", MOCKED_FILTER)
                 assert type(result) is pd.DataFrame
                 assert result.shape[0] == 0
 
 
+class TestBatchSearchAsync:
+    async def test_returns_results_in_order_with_errors(self):
+        client = GdeltClient()
+        filters_list = [Filters(keyword=keyword, timespan="1d") for keyword in ("a", "b", "c")]
+
+        async def fake_query(mode, query_string):
+            keyword = query_string.split("&")[0].strip().strip('"')
+            if keyword == "b":
+                raise ValueError("Invalid query")
+            return {"articles": [{"title": keyword}]}
+
+        with mock.patch.object(client, "_aquery", side_effect=fake_query):
+            results = await client.abatch_article_search(filters_list)
+
+        assert len(results) == 3
+        assert isinstance(results[1], ValueError)
+        assert results[0]["title"].iloc[0] == "a"
+        assert results[2]["title"].iloc[0] == "c"
+
+    async def test_limits_concurrency(self):
+        client = GdeltClient()
+        in_flight = 0
+        peak = 0
+
+        async def fake_query(mode, query_string):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"timeline": []}
+
+        filters_list = [Filters(keyword="test", timespan="1d") for _ in range(10)]
+        with mock.patch.object(client, "_aquery", side_effect=fake_query):
+            results = await client.abatch_timeline_search("timelinevol", filters_list, max_concurrency=3)
+
+        assert len(results) == 10
+        assert peak == 3
+
+
 class TestQueryAsync:
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_handles_invalid_query_string(self):
-        async with GdeltClient() as gd:
+    @pytest.mark.vcr
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handles_invalid_query_string(self, aio_session):
+        async with GdeltClient(aio_session=aio_session) as gd:
             with pytest.raises(ValueError, match=r"Invalid query"):
                 await gd._aquery("artlist", "environment&timespan=mins15")
 
@@ -190,151 +192,56 @@ class TestQueryAsync:
                     await gd._aquery("artlist", "")
 
 
+@pytest.mark.vcr
 class TestArticleSearchSync:
     """
     Test that the API client behaves correctly when doing an article search query (sync)
     """
 
     @pytest.mark.integration
-    def test_articles_is_a_df(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        client = GdeltClient()
-        articles = client.article_search(f)
+    def test_articles_is_a_df(self, http_session, default_filter):
+        client = GdeltClient(session=http_session)
+        articles = client.article_search(default_filter)
 
         assert type(articles) is pd.DataFrame
 
-    @pytest.mark.integration
-    def test_correct_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        client = GdeltClient()
-        articles = client.article_search(f)
-
-        assert list(articles.columns) == [
-            "url",
-            "url_mobile",
-            "title",
-            "seendate",
-            "socialimage",
-            "domain",
-            "language",
-            "sourcecountry",
-        ]
-
-    @pytest.mark.integration
-    def test_rows_returned(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        client = GdeltClient()
-        articles = client.article_search(f)
-
-        assert articles.shape[0] >= 1
-
 
+@pytest.mark.vcr
 class TestTimelineSearchSync:
     """
     Test that the various modes of timeline search behave correctly (sync)
     """
 
     @pytest.mark.integration
-    def test_all_modes_return_a_df(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        gd = GdeltClient()
-        all_results = []
-        for mode in [
-            "timelinevol",
-            "timelinevolraw",
-            "timelinelang",
-            "timelinetone",
-            "timelinesourcecountry",
-        ]:
-            result = gd.timeline_search(mode, f)
-            all_results.append(result)
-
-        assert all(type(result) is pd.DataFrame for result in all_results)
+    @pytest.mark.parametrize("mode", TIMELINE_MODES)
+    def test_all_modes_return_a_df(self, mode, sync_timeline_results):
+        assert type(sync_timeline_results[mode]) is pd.DataFrame
 
     @pytest.mark.integration
-    def test_all_modes_return_data(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        gd = GdeltClient()
-        all_results = []
-        for mode in [
-            "timelinevol",
-            "timelinevolraw",
-            "timelinelang",
-            "timelinetone",
-            "timelinesourcecountry",
-        ]:
-            result = gd.timeline_search(mode, f)
-            all_results.append(result)
-
-        assert all(result.shape[0] >= 1 for result in all_results)
-
-    @pytest.mark.integration
-    def test_unsupported_mode(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
+    def test_unsupported_mode(self, default_filter):
         with pytest.raises(ValueError, match="Invalid"):
             gd = GdeltClient()
-            gd.timeline_search(
-                "unsupported",
-                Filters(
-                    keyword="environment",
-                    start_date=start_date,
-                    end_date=end_date,
-                ),
-            )
+            gd.timeline_search("unsupported", default_filter)
 
     @pytest.mark.integration
-    def test_vol_has_two_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        gd = GdeltClient()
-        result = gd.timeline_search("timelinevol", f)
-
-        assert result.shape[1] == 2
-
-    @pytest.mark.integration
-    def test_vol_raw_has_three_columns(self):
-        start_date = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (datetime.today() - timedelta(days=6)).strftime("%Y-%m-%d")
-
-        f = Filters(keyword="environment", start_date=start_date, end_date=end_date)
-        gd = GdeltClient()
-        result = gd.timeline_search("timelinevolraw", f)
-
-        assert result.shape[1] == 3
+    def test_vol_has_two_columns(self, sync_timeline_results):
+        assert sync_timeline_results["timelinevol"].shape[1] == 2
 
     def test_handles_empty_API_response(self):
         gd = GdeltClient()
 
         with mock.patch.object(gd, "_query") as query_mock:
             query_mock.return_value = {}
-            result = gd.timeline_search("timelinetone", Filters(keyword="environment", timespan="1h"))
+            result = gd.timeline_search("timelinetone", MOCKED_FILTER)
             assert type(result) is pd.DataFrame
             assert result.shape[0] == 0
 
 
 class TestQuerySync:
     @pytest.mark.integration
-    def test_handles_invalid_query_string(self):
-        gd = GdeltClient()
+    @pytest.mark.vcr
+    def test_handles_invalid_query_string(self, http_session):
+        gd = GdeltClient(session=http_session)
 
         with pytest.raises(ValueError, match=r"Invalid query"):
             gd._query("artlist", "environment&timespan=mins15")
@@ -348,7 +255,7 @@ class TestQuerySync:
         mock_response.reason = "Too Many Requests"
         mock_response.headers = {"content-type": "application/json"}
 
-        with mock.patch("gdelt_client.api_client.Session") as mock_session_class:
+        with mock.patch("requests.Session") as mock_session_class:
             mock_session = mock.Mock()
             mock_session.get.return_value = mock_response
             mock_session_class.return_value = mock_session
@@ -357,44 +264,47 @@ class TestQuerySync:
                 gd._query("artlist", "")
 
 
-class TestBuildUrls:
-    def test_builds_events_url(self):
-        from gdelt_client.enums import GdeltTable
-
-        client = GdeltClient()
-        urls = client._build_urls(["20200115234500"], GdeltTable.EVENTS, translation=False)
-
-        assert len(urls) == 1
-        assert urls[0] == "http://data.gdeltproject.org/gdeltv2/20200115234500.export.CSV.zip"
-
-    def test_builds_mentions_url(self):
-        from gdelt_client.enums import GdeltTable
-
-        client = GdeltClient()
-        urls = client._build_urls(["20200115234500"], GdeltTable.MENTIONS, translation=False)
-
-        assert urls[0] == "http://data.gdeltproject.org/gdeltv2/20200115234500.mentions.CSV.zip"
+class TestInstallFastLoop:
+    def test_installs_uvloop_policy(self, monkeypatch):
+        import sys
+        import types
 
-    def test_builds_gkg_url(self):
-        from gdelt_client.enums import GdeltTable
+        policy = asyncio.DefaultEventLoopPolicy()
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.EventLoopPolicy = lambda: policy
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
 
-        client = GdeltClient()
-        urls = client._build_urls(["20200115234500"], GdeltTable.GKG, translation=False)
+        with mock.patch("asyncio.set_event_loop_policy") as set_policy:
+            GdeltClient.install_fast_loop()
 
-        assert urls[0] == "http://data.gdeltproject.org/gdeltv2/20200115234500.gkg.csv.zip"
+        set_policy.assert_called_once_with(policy)
 
-    def test_builds_translation_url(self):
-        from gdelt_client.enums import GdeltTable
+    def test_raises_when_no_fast_loop_installed(self, monkeypatch):
+        import sys
 
-        client = GdeltClient()
-        urls = client._build_urls(["20200115234500"], GdeltTable.EVENTS, translation=True)
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        monkeypatch.setitem(sys.modules, "uringcore", None)
 
-        assert urls[0] == "http://data.gdeltproject.org/gdeltv2/20200115234500.translation.export.CSV.zip"
+        with pytest.raises(ImportError, match="uvloop or uringcore is required"):
+            GdeltClient.install_fast_loop()
 
-    def test_builds_multiple_urls(self):
-        from gdelt_client.enums import GdeltTable
 
-        client = GdeltClient()
+class TestBuildUrls:
+    @pytest.mark.parametrize(
+        ("table", "translation", "suffix"),
+        [
+            (GdeltTable.EVENTS, False, ".export.CSV.zip"),
+            (GdeltTable.MENTIONS, False, ".mentions.CSV.zip"),
+            (GdeltTable.GKG, False, ".gkg.csv.zip"),
+            (GdeltTable.EVENTS, True, ".translation.export.CSV.zip"),
+        ],
+    )
+    def test_builds_url(self, client, table, translation, suffix):
+        urls = client._build_urls(["20200115234500"], table, translation=translation)
+
+        assert urls == [f"http://data.gdeltproject.org/gdeltv2/20200115234500{suffix}"]
+
+    def test_builds_multiple_urls(self, client):
         urls = client._build_urls(
             ["20200115234500", "20200116234500"],
             GdeltTable.EVENTS,
@@ -404,30 +314,45 @@ class TestBuildUrls:
         assert len(urls) == 2
 
 
-class TestSchema:
-    def test_returns_dataframe(self):
+class TestBuildQueryUrl:
+    def test_encodes_query_and_keeps_parameters(self):
         client = GdeltClient()
-        schema = client.schema("events")
+        filters = Filters(keyword=["climate change", "c++"], timespan="1d", num_records=10)
 
-        assert isinstance(schema, pd.DataFrame)
+        url = client._build_query_url("artlist", filters.query_string)
+
+        assert url == (
+            f"{client.DOC_API_URL}?query=%28%22climate%20change%22%20OR%20c%2B%2B%29%20"
+            "&timespan=1d&maxrecords=10&mode=artlist&format=json"
+        )
+
+    def test_handles_query_without_keywords(self):
+        from gdelt_client.enums import TimeSeriesMode
 
-    def test_has_name_column(self):
         client = GdeltClient()
-        schema = client.schema("events")
+        filters = Filters(start_date="2020-05-10", end_date="2020-05-11")
+
+        url = client._build_query_url(TimeSeriesMode.VOLUME, filters.query_string)
+
+        assert "?query=&startdatetime=20200510000000&enddatetime=20200511000000&" in url
+        assert url.endswith("&mode=timelinevol&format=json")
+
+
+class TestSchema:
+    def test_returns_dataframe(self, events_schema):
+        assert isinstance(events_schema, pd.DataFrame)
 
-        assert "name" in schema.columns
+    def test_has_name_column(self, events_schema):
+        assert "name" in events_schema.columns
 
-    def test_works_with_enum(self):
+    def test_works_with_enum(self, client):
         from gdelt_client.enums import GdeltTable
 
-        client = GdeltClient()
         schema = client.schema(GdeltTable.MENTIONS)
 
         assert isinstance(schema, pd.DataFrame)
 
-    def test_raises_for_invalid_table(self):
-        client = GdeltClient()
-
+    def test_raises_for_invalid_table(self, client):
         with pytest.raises(ValueError, match="Unknown table"):
             client.schema("invalid")
 
@@ -474,37 +399,77 @@ class TestFormatOutput:
 
 
 class TestCameoCodes:
-    def test_lazy_loads_cameo_codes(self):
-        client = GdeltClient()
-
-        assert client._cameo_codes is None
-
+    def test_loads_cameo_codes(self, client):
         codes = client.cameo_codes
 
-        assert codes is not None
         assert isinstance(codes, pd.DataFrame)
-        assert client._cameo_codes is not None
+        assert "Description" in codes.columns
 
     def test_caches_cameo_codes(self):
+        from gdelt_client.helpers import _read_cameo_codes
+
+        first = GdeltClient().cameo_codes
+        hits = _read_cameo_codes.cache_info().hits
+        second = GdeltClient().cameo_codes
+
+        assert first is not second
+
+        assert _read_cameo_codes.cache_info().hits == hits + 1
+
+
+class TestOptimizeDtypes:
+    def test_downcasts_and_categorizes(self):
+        from gdelt_client.api_client import _optimize_dtypes
+
+        df = pd.DataFrame({
+            "id": [1, 2, 3, 4],
+            "tone": [1.5, -2.25, 0.0, 3.0],
+            "lat": [40.7128, 51.5074, 0.1, 0.2],
+            "country": ["US", "US", "US", "US"],
+            "url": ["a", "b", "c", "d"],
+        })
+
+        result = _optimize_dtypes(df)
+
+        assert result["id"].dtype == "int8"
+        assert result["tone"].dtype == "float64"
+        assert result["lat"].iloc[1] == 51.5074
+        assert isinstance(result["country"].dtype, pd.CategoricalDtype)
+        assert not isinstance(result["url"].dtype, pd.CategoricalDtype)
+
+    def test_keeps_float_precision(self):
+        from gdelt_client.api_client import _optimize_dtypes
+
+        result = _optimize_dtypes(pd.DataFrame({"lat": [52.123456, -33.8688]}))
+
+        assert result["lat"].tolist() == [52.123456, -33.8688]
+
+    def test_search_skips_optimization_by_default(self):
         client = GdeltClient()
 
-        codes1 = client.cameo_codes
-        codes2 = client.cameo_codes
+        with mock.patch.object(client, "_download_and_parse", return_value=pd.DataFrame({"Col1": [1]})):
+            result = client.search("2024-01-15", table="mentions")
+
+        assert result["Col1"].dtype == "int64"
+
+    def test_search_optimizes_when_enabled(self):
+        client = GdeltClient(optimize_dtypes=True)
+
+        with mock.patch.object(client, "_download_and_parse", return_value=pd.DataFrame({"Col1": [1]})):
+            result = client.search("2024-01-15", table="mentions")
 
-        assert codes1 is codes2
+        assert result["Col1"].dtype == "int8"
 
 
 class TestAddCameoDescriptions:
-    def test_adds_description_column(self):
-        client = GdeltClient()
+    def test_adds_description_column(self, client):
         df = pd.DataFrame({"EventCode": ["01", "02"], "OtherCol": [1, 2]})
 
         result = client._add_cameo_descriptions(df)
 
         assert "CAMEOCodeDescription" in result.columns
 
-    def test_inserts_after_event_code(self):
-        client = GdeltClient()
+    def test_inserts_after_event_code(self, client):
         df = pd.DataFrame({"Col1": [1], "EventCode": ["01"], "Col2": [2]})
 
         result = client._add_cameo_descriptions(df)
@@ -512,8 +477,22 @@ class TestAddCameoDescriptions:
 
         assert cols.index("CAMEOCodeDescription") == cols.index("EventCode") + 1
 
-    def test_returns_unchanged_if_no_event_code(self):
-        client = GdeltClient()
+    def test_falls_back_for_unknown_code(self, client):
+        df = pd.DataFrame({"EventCode": ["01", "999999"]})
+
+        result = client._add_cameo_descriptions(df)
+
+        assert "No description" not in result["CAMEOCodeDescription"].iloc[0]
+        assert result["CAMEOCodeDescription"].iloc[1] == "No description for CAMEO code 999999"
+
+    def test_falls_back_for_missing_code(self, client):
+        df = pd.DataFrame({"EventCode": ["01", None]})
+
+        result = client._add_cameo_descriptions(df)
+
+        assert result["CAMEOCodeDescription"].iloc[1] == "No description for CAMEO code nan"
+
+    def test_returns_unchanged_if_no_event_code(self, client):
         df = pd.DataFrame({"Col1": [1], "Col2": [2]})
 
         result = client._add_cameo_descriptions(df)
@@ -543,97 +522,63 @@ class TestSearchValidation:
 
 
 class TestSearchWithMockedDownload:
-    def test_search_returns_dataframe(self):
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"GLOBALEVENTID": [1, 2], "EventCode": ["01", "02"]})
-
-        with mock.patch.object(client, "_download_and_parse", return_value=mock_df):
-            result = client.search("2020-01-15")
+    def test_search_returns_dataframe(self, patched_client):
+        result = patched_client.search("2020-01-15")
 
         assert isinstance(result, pd.DataFrame)
 
-    def test_search_adds_cameo_descriptions_for_events(self):
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"GLOBALEVENTID": [1], "EventCode": ["01"]})
-
-        with mock.patch.object(client, "_download_and_parse", return_value=mock_df):
-            result = client.search("2020-01-15", table="events")
+    def test_search_adds_cameo_descriptions_for_events(self, patched_client):
+        result = patched_client.search("2020-01-15", table="events")
 
         assert "CAMEOCodeDescription" in result.columns
 
-    def test_search_returns_json_output(self):
+    def test_search_returns_json_output(self, patched_client):
         from gdelt_client.enums import OutputFormat
 
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"Col1": [1, 2]})
-
-        with (
-            mock.patch.object(client, "_download_and_parse", return_value=mock_df),
-            mock.patch.object(client, "_add_cameo_descriptions", return_value=mock_df),
-        ):
-            result = client.search("2020-01-15", output=OutputFormat.JSON)
+        result = patched_client.search("2020-01-15", output=OutputFormat.JSON)
 
         assert isinstance(result, str)
 
-    def test_search_raises_when_no_data(self):
-        client = GdeltClient()
+    def test_search_raises_when_no_data(self, patched_client):
+        patched_client._download_and_parse.return_value = pd.DataFrame()
 
-        with (
-            mock.patch.object(client, "_download_and_parse", return_value=pd.DataFrame()),
-            pytest.raises(ValueError, match="No data returned"),
-        ):
-            client.search("2020-01-15")
+        with pytest.raises(ValueError, match="No data returned"):
+            patched_client.search("2020-01-15")
 
-    def test_search_with_coverage_calls_multiple_urls(self):
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"Col1": [1]})
+    def test_search_with_coverage_calls_multiple_urls(self, patched_client):
+        # Only the download calls matter here; a single-cell mentions frame keeps the CAMEO lookup and concat trivial
+        patched_client._download_and_parse.return_value = pd.DataFrame({"Col1": [1]})
 
-        with (
-            mock.patch.object(client, "_download_and_parse", return_value=mock_df) as mock_download,
-            mock.patch.object(client, "_add_cameo_descriptions", return_value=mock_df),
-        ):
-            client.search("2020-01-15", coverage=True)
+        patched_client.search("2020-01-15", table="mentions", coverage=True)
 
-        assert mock_download.call_count == 96
+        urls = {call.args[0] for call in patched_client._download_and_parse.call_args_list}
+        assert patched_client._download_and_parse.call_count == 96
+        assert len(urls) == 96
 
 
 class TestAsyncSearchWithMockedDownload:
     @pytest.mark.asyncio
-    async def test_asearch_returns_dataframe(self):
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"GLOBALEVENTID": [1, 2], "EventCode": ["01", "02"]})
-
-        with mock.patch.object(client, "_adownload_and_parse", new_callable=mock.AsyncMock, return_value=mock_df):
-            result = await client.asearch("2020-01-15")
+    async def test_asearch_returns_dataframe(self, patched_client):
+        result = await patched_client.asearch("2020-01-15")
 
         assert isinstance(result, pd.DataFrame)
 
     @pytest.mark.asyncio
-    async def test_asearch_raises_when_no_data(self):
-        client = GdeltClient()
+    async def test_asearch_raises_when_no_data(self, patched_client):
+        patched_client._adownload_and_parse.return_value = pd.DataFrame()
 
-        with (
-            mock.patch.object(client, "_adownload_and_parse", new_callable=mock.AsyncMock, return_value=pd.DataFrame()),
-            pytest.raises(ValueError, match="No data returned"),
-        ):
-            await client.asearch("2020-01-15")
+        with pytest.raises(ValueError, match="No data returned"):
+            await patched_client.asearch("2020-01-15")
 
     @pytest.mark.asyncio
-    async def test_asearch_with_multiple_urls(self):
-        client = GdeltClient()
-        mock_df = pd.DataFrame({"Col1": [1]})
-
-        with (
-            mock.patch.object(client, "_adownload_and_parse", new_callable=mock.AsyncMock, return_value=mock_df),
-            mock.patch.object(client, "_add_cameo_descriptions", return_value=mock_df),
-        ):
-            result = await client.asearch(["2020-01-15", "2020-01-16"])
+    async def test_asearch_with_multiple_urls(self, patched_client):
+        result = await patched_client.asearch(["2020-01-15", "2020-01-16"])
 
         assert isinstance(result, pd.DataFrame)
+        assert patched_client._adownload_and_parse.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_asearch_filters_exceptions_from_gather(self):
-        client = GdeltClient()
+    async def test_asearch_filters_exceptions_from_gather(self, patched_client):
         mock_df = pd.DataFrame({"Col1": [1]})
 
         async def mock_download(url, table, columns):
@@ -641,13 +586,12 @@ class TestAsyncSearchWithMockedDownload:
                 raise ValueError("Download failed")
             return mock_df
 
-        with (
-            mock.patch.object(client, "_adownload_and_parse", side_effect=mock_download),
-            mock.patch.object(client, "_add_cameo_descriptions", return_value=mock_df),
-        ):
-            result = await client.asearch(["2020-01-15", "2020-01-16"])
+        patched_client._adownload_and_parse.side_effect = mock_download
+
+        result = await patched_client.asearch(["2020-01-15", "2020-01-16"])
 
         assert isinstance(result, pd.DataFrame)
+        assert len(result) == 1
 
 
 class TestParseArticles:
@@ -666,6 +610,53 @@ class TestParseArticles:
         assert len(result) == 2
         assert "url" in result.columns
 
+    @pytest.mark.parametrize("n", [1, 100, 10_000])
+    def test_parses_large_article_lists(self, n):
+        from gdelt_client.api_client import _ARTICLE_COLUMNS, _parse_articles
+
+        articles = {"articles": [{"url": f"http://x/{i}", "seendate": "20200510T121500Z"} for i in range(n)]}
+        result = _parse_articles(articles)
+
+        assert result.shape == (n, len(_ARTICLE_COLUMNS))
+        assert result["url"].iloc[-1] == f"http://x/{n - 1}"
+
+    def test_uses_article_schema(self):
+        from gdelt_client.api_client import _ARTICLE_COLUMNS, _parse_articles
+
+        articles = {
+            "articles": [
+                {"url": "http://example.com", "title": "Test", "seendate": "20200510T121500Z", "extra": 1},
+            ]
+        }
+        result = _parse_articles(articles)
+
+        assert list(result.columns) == list(_ARTICLE_COLUMNS)
+        assert result["seendate"].iloc[0] == pd.Timestamp("2020-05-10 12:15:00", tz="UTC")
+        assert pd.api.types.is_string_dtype(result["title"])
+        assert result["domain"].isna().all()
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_article_text_columns_are_strings(self, monkeypatch, use_pyarrow):
+        from gdelt_client.api_client import _parse_articles
+
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa", None)
+
+        result = _parse_articles({"articles": [{"url": "http://example.com", "seendate": "20200510T121500Z"}]})
+
+        assert pd.api.types.is_string_dtype(result["url"])
+        assert result["title"].isna().all()
+        assert result["seendate"].iloc[0] == pd.Timestamp("2020-05-10 12:15:00", tz="UTC")
+
+    def test_falls_back_for_non_string_fields(self):
+        from gdelt_client.api_client import _parse_articles
+
+        result = _parse_articles({"articles": [{"url": "http://example.com", "title": 123}]})
+
+        assert result["title"].iloc[0] == "123"
+
     def test_returns_empty_df_when_no_articles_key(self):
         from gdelt_client.api_client import _parse_articles
 
@@ -705,6 +696,54 @@ class TestParseTimeline:
         assert "Series1" in result.columns
         assert len(result) == 2
 
+    @pytest.mark.parametrize("mode", ["timelinevol", "timelinevolraw"])
+    def test_stores_null_values_as_nan(self, mode):
+        from gdelt_client.api_client import _parse_timeline
+
+        data = [
+            {"date": "2020-01-15T00:00:00Z", "value": 10, "norm": 100},
+            {"date": "2020-01-16T00:00:00Z", "value": None, "norm": 100},
+        ]
+        result = _parse_timeline({"timeline": [{"series": "Series1", "data": data}]}, mode)
+
+        assert result["Series1"].iloc[0] == 10
+        assert pd.isna(result["Series1"].iloc[1])
+
+    def test_parses_long_iso_timeline_as_utc(self):
+        from gdelt_client.api_client import _parse_timeline
+
+        dates = pd.date_range("2020-01-01", periods=10_000, freq="15min").strftime("%Y-%m-%dT%H:%M:%SZ")
+        timeline = {
+            "timeline": [
+                {"series": name, "data": [{"date": date, "value": 1.5} for date in dates]}
+                for name in ("English", "French")
+            ]
+        }
+        result = _parse_timeline(timeline, "timelinelang")
+
+        assert len(result) == 10_000
+        assert isinstance(result["datetime"].dtype, pd.DatetimeTZDtype)
+        assert str(result["datetime"].dt.tz) == "UTC"
+        assert result["datetime"].iloc[-1] == pd.Timestamp("2020-04-14 03:45:00", tz="UTC")
+
+    def test_parses_compact_dates_as_utc(self):
+        from gdelt_client.api_client import _parse_timeline
+
+        timeline = {
+            "timeline": [
+                {
+                    "series": "Series1",
+                    "data": [
+                        {"date": "20200115T000000Z", "value": 10},
+                        {"date": "20200115T001500Z", "value": 20},
+                    ],
+                }
+            ]
+        }
+        result = _parse_timeline(timeline, "timelinevol")
+
+        assert result["datetime"].iloc[1] == pd.Timestamp("2020-01-15 00:15:00", tz="UTC")
+
     def test_parses_volume_raw_with_norm(self):
         from gdelt_client.api_client import _parse_timeline
         from gdelt_client.enums import TimeSeriesMode
@@ -723,6 +762,33 @@ class TestParseTimeline:
 
         assert "All Articles" in result.columns
 
+    @pytest.mark.parametrize(
+        ("sample", "expected"),
+        [
+            ("20200115T001500Z", "%Y%m%dT%H%M%SZ"),
+            ("20200115001500", "%Y%m%d%H%M%S"),
+            ("2020-01-15T00:15:00Z", "ISO8601"),
+        ],
+    )
+    def test_detects_date_format(self, sample, expected):
+        from gdelt_client.api_client import _doc_api_date_format
+
+        assert _doc_api_date_format(sample) == expected
+
+    def test_series_are_numeric_arrays(self):
+        from gdelt_client.api_client import _parse_timeline
+        from gdelt_client.enums import TimeSeriesMode
+
+        data = [{"date": "20200115T000000Z", "value": 10, "norm": 100}]
+        timeline = {"timeline": [{"series": "Series1", "data": data}]}
+
+        tone = _parse_timeline(timeline, TimeSeriesMode.TONE)
+        raw = _parse_timeline(timeline, TimeSeriesMode.VOLUME_RAW)
+
+        assert tone["Series1"].dtype == "float64"
+        assert raw["Series1"].dtype == "int64"
+        assert raw["All Articles"].iloc[0] == 100
+
     def test_returns_empty_df_for_empty_timeline(self):
         from gdelt_client.api_client import _parse_timeline
 
@@ -758,7 +824,7 @@ class TestArticleSearchMocked:
         mock_response = {"articles": [{"url": "http://example.com", "title": "Test"}]}
 
         with mock.patch.object(client, "_query", return_value=mock_response):
-            result = client.article_search(Filters(keyword="test", timespan="1h"))
+            result = client.article_search(MOCKED_FILTER)
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
@@ -777,48 +843,85 @@ class TestTimelineSearchMocked:
         }
 
         with mock.patch.object(client, "_query", return_value=mock_response):
-            result = client.timeline_search("timelinevol", Filters(keyword="test", timespan="1h"))
+            result = client.timeline_search("timelinevol", MOCKED_FILTER)
 
         assert isinstance(result, pd.DataFrame)
         assert "Test" in result.columns
 
 
-class TestQuerySessionCreation:
-    def test_creates_session_if_none(self):
+class TestClose:
+    def test_close_releases_owned_session(self):
         client = GdeltClient()
+        session = client._get_session()
+
+        with mock.patch.object(session, "close") as mock_close:
+            client.close()
+
+        mock_close.assert_called_once()
         assert client.session is None
 
-        mock_response = mock.Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "application/json"}
-        mock_response.content = b'{"test": "data"}'
+    def test_close_keeps_user_session(self):
+        session = mock.Mock()
+        client = GdeltClient(session=session)
 
-        with mock.patch("gdelt_client.api_client.Session") as mock_session_class:
-            mock_session = mock.Mock()
-            mock_session.get.return_value = mock_response
-            mock_session_class.return_value = mock_session
+        client.close()
 
-            client._query("artlist", "test")
+        session.close.assert_not_called()
+        assert client.session is session
+
+    async def test_aclose_releases_owned_aio_session(self):
+        client = GdeltClient()
+        session = client._get_aio_session()
+
+        await client.aclose()
 
-            mock_session_class.assert_called_once()
-            mock_session.headers.update.assert_called_once()
+        assert session.closed
+        assert client.aio_session is None
 
-    def test_raises_on_html_error_response(self):
+
+class TestQuerySessionCreation:
+    def test_creates_session_if_none(self, stub_http):
         client = GdeltClient()
+        assert client.session is None
 
-        mock_response = mock.Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.text = "Error: Invalid query"
+        result = client._query("artlist", "test")
 
-        with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
-            pytest.raises(ValueError, match="Invalid query"),
-        ):
-            mock_session = mock.Mock()
-            mock_session.get.return_value = mock_response
-            mock_session_class.return_value = mock_session
+        assert result == {"test": "data"}
+        assert client.session is not None
+        assert len(stub_http.calls) == 1
+        assert stub_http.calls[0].url.startswith("https://api.gdeltproject.org/")
+        assert stub_http.calls[0].headers["User-Agent"] == client.default_headers["User-Agent"]
+
+    def test_session_advertises_compression(self):
+        client = GdeltClient()
+
+        session = client._get_session()
+
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_session_pool_matches_max_workers(self):
+        client = GdeltClient(max_workers=4)
+
+        session = client._get_session()
+        adapter = session.get_adapter("http://data.gdeltproject.org/gdeltv2/")
 
+        assert adapter._pool_maxsize == 4
+        assert client._get_session() is session
+
+    async def test_aio_connector_limit_matches_concurrency(self):
+        async with GdeltClient(max_concurrent_downloads=7) as client:
+            session = client._get_aio_session()
+
+            assert session.connector.limit == 7
+            assert session.connector.limit_per_host == 7
+            assert client._get_aio_session() is session
+            assert session.auto_decompress
+
+    def test_raises_on_html_error_response(self, stub_http):
+        client = GdeltClient()
+        stub_http.respond(b"Error: Invalid query", content_type="text/html")
+
+        with pytest.raises(ValueError, match="Invalid query"):
             client._query("artlist", "test")
 
 
@@ -829,7 +932,7 @@ class TestAsyncQueryMocked:
         mock_response = {"articles": [{"url": "http://example.com", "title": "Test"}]}
 
         with mock.patch.object(client, "_aquery", new_callable=mock.AsyncMock, return_value=mock_response):
-            result = await client.aarticle_search(Filters(keyword="test", timespan="1h"))
+            result = await client.aarticle_search(MOCKED_FILTER)
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
@@ -847,86 +950,384 @@ class TestAsyncQueryMocked:
         }
 
         with mock.patch.object(client, "_aquery", new_callable=mock.AsyncMock, return_value=mock_response):
-            result = await client.atimeline_search("timelinevol", Filters(keyword="test", timespan="1h"))
+            result = await client.atimeline_search("timelinevol", MOCKED_FILTER)
 
         assert isinstance(result, pd.DataFrame)
 
 
+@cache
+def _zip_csv(csv_content: str) -> bytes:
+    """Zip a tab-separated payload the way GDELT ships its raw files; identical payloads are built once."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("data.csv", csv_content)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def zip_bytes() -> bytes:
+    return _zip_csv("val1\tval2\tval3\n")
+
+
 class TestParseGdeltFile:
-    def test_parses_zip_file_with_matching_columns(self):
-        import io
-        import zipfile
+    def test_parses_zip_file_with_matching_columns(self, client, zip_bytes):
+        from gdelt_client.enums import GdeltTable
 
+        columns = ["Col1", "Col2", "Col3"]
+
+        result = client._parse_gdelt_file(zip_bytes, GdeltTable.MENTIONS, columns)
+
+        assert list(result.columns) == columns
+
+    def test_parses_zip_file_with_one_less_column(self, client, zip_bytes):
+        from gdelt_client.enums import GdeltTable
+
+        columns = ["Col1", "Col2", "Col3", "Col4"]
+
+        result = client._parse_gdelt_file(zip_bytes, GdeltTable.MENTIONS, columns)
+
+        assert list(result.columns) == ["Col1", "Col2", "Col3"]
+
+    def test_warns_on_column_mismatch(self):
         client = GdeltClient()
+        columns = ["Col1", "Col2"]
+
+        data = _zip_csv("val1\tval2\tval3\tval4\tval5\n")
+
+        from gdelt_client.enums import GdeltTable
+
+        with pytest.warns(UserWarning, match="Column count mismatch"):
+            client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
+
+    def test_uses_dtype_overrides_for_events(self):
+        client = GdeltClient()
+        columns = ["C" + str(i) for i in range(30)]
+
+        data = _zip_csv("\t".join(["v" + str(i) for i in range(30)]) + "\n")
+
+        from gdelt_client.enums import GdeltTable
+
+        result = client._parse_gdelt_file(data, GdeltTable.EVENTS, columns)
+
+        assert isinstance(result, pd.DataFrame)
+
+    def test_parses_in_process_pool(self, zip_bytes):
+        from gdelt_client.enums import GdeltTable
+
         columns = ["Col1", "Col2", "Col3"]
 
-        csv_content = "val1\tval2\tval3\n"
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("data.csv", csv_content)
-        buffer.seek(0)
+        with GdeltClient(parse_processes=1) as client:
+            result = client._parse_gdelt_file(zip_bytes, GdeltTable.MENTIONS, columns)
+            assert client._process_pool is not None
+
+        assert list(result.columns) == columns
+        assert client._process_pool is None
+
+    def test_creates_one_process_pool_for_concurrent_callers(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = GdeltClient(parse_processes=1)
+
+        def slow_pool(**kwargs):
+            time.sleep(0.05)
+            return mock.Mock()
+
+        with (
+            mock.patch("gdelt_client.api_client.ProcessPoolExecutor", side_effect=slow_pool) as pool_cls,
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            pools = list(executor.map(lambda _: client._get_process_pool(), range(4)))
+
+        assert pool_cls.call_count == 1
+        assert all(pool is pools[0] for pool in pools)
+
+    def test_pyarrow_results_concatenate_without_copy(self):
+        pytest.importorskip("pyarrow")
+
+        client = GdeltClient()
+        columns = ["Col1", "Col2"]
+        data = _zip_csv("1\tval\n2\tval\n")
+
+        from gdelt_client.enums import GdeltTable
+
+        df = client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
+        result = pd.concat([df, df], ignore_index=True)
+
+        assert isinstance(result["Col1"].dtype, pd.ArrowDtype)
+        assert result["Col1"].array._pa_array.num_chunks == 2
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_events_code_columns_keep_leading_zeros(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
+
+        client = GdeltClient()
+        columns = ["C" + str(i) for i in range(30)]
+
+        values = [str(i) for i in range(30)]
+        values[26:29] = ["010", "010", "01"]
+        data = _zip_csv("\t".join(values) + "\n")
 
         from gdelt_client.enums import GdeltTable
 
-        result = client._parse_gdelt_file(buffer.read(), GdeltTable.MENTIONS, columns)
+        result = client._parse_gdelt_file(data, GdeltTable.EVENTS, columns)
 
         assert list(result.columns) == columns
+        assert result["C26"].iloc[0] == "010"
+        assert result["C28"].iloc[0] == "01"
 
-    def test_parses_zip_file_with_one_less_column(self):
-        import io
-        import zipfile
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_keeps_rows_with_missing_trailing_fields(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
 
         client = GdeltClient()
-        columns = ["Col1", "Col2", "Col3", "Col4"]
+        columns = ["GLOBALEVENTID", "EventTimeDate", "MentionTimeDate"]
+        data = _zip_csv("1\t20200101000000\t20200101000000\n2\t20200101000000\n")
+
+        from gdelt_client.enums import GdeltTable
 
-        csv_content = "val1\tval2\tval3\n"
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("data.csv", csv_content)
-        buffer.seek(0)
+        result = client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
+
+        assert result["GLOBALEVENTID"].tolist() == [1, 2]
+        assert pd.isna(result["MentionTimeDate"].iloc[1])
+
+    def test_short_row_fallback_keeps_arrow_dtypes(self):
+        pytest.importorskip("pyarrow")
+
+        client = GdeltClient()
+        columns = ["C" + str(i) for i in range(61)]
+        row = "\t".join(["1", "20200101", *["010"] * 59])
+        short = _zip_csv(row + "\n" + row.rsplit("\t", 1)[0] + "\n")
 
         from gdelt_client.enums import GdeltTable
 
-        result = client._parse_gdelt_file(buffer.read(), GdeltTable.MENTIONS, columns)
+        full = client._parse_gdelt_file(_zip_csv(row + "\n"), GdeltTable.EVENTS, columns)
+        padded = client._parse_gdelt_file(short, GdeltTable.EVENTS, columns)
 
-        assert list(result.columns) == ["Col1", "Col2", "Col3"]
+        assert padded.dtypes.tolist() == full.dtypes.tolist()
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in pd.concat([full, padded]).dtypes)
 
-    def test_warns_on_column_mismatch(self):
-        import io
-        import zipfile
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_skips_rows_with_extra_fields(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
 
         client = GdeltClient()
-        columns = ["Col1", "Col2"]
+        columns = ["GLOBALEVENTID", "EventTimeDate"]
+        data = _zip_csv("1\t20200101000000\n2\t20200101000000\textra\n3\t20200101000000\n")
 
-        csv_content = "val1\tval2\tval3\tval4\tval5\n"
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("data.csv", csv_content)
-        buffer.seek(0)
+        from gdelt_client.enums import GdeltTable
+
+        result = client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
+
+        assert result["GLOBALEVENTID"].tolist() == [1, 3]
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_falls_back_for_non_integral_integer_column(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
+
+        client = GdeltClient()
+        columns = ["GLOBALEVENTID", "EventTimeDate"]
+        data = _zip_csv("1.5\t20200101000000\n2\t20200101000000\n")
 
         from gdelt_client.enums import GdeltTable
 
-        with pytest.warns(UserWarning, match="Column count mismatch"):
-            client._parse_gdelt_file(buffer.read(), GdeltTable.MENTIONS, columns)
+        result = client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
 
-    def test_uses_dtype_overrides_for_events(self):
-        import io
-        import zipfile
+        assert result["GLOBALEVENTID"].tolist() == [1.5, 2.0]
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_fallback_keeps_events_code_columns_as_strings(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
 
         client = GdeltClient()
         columns = ["C" + str(i) for i in range(30)]
 
-        csv_content = "\t".join(["v" + str(i) for i in range(30)]) + "\n"
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("data.csv", csv_content)
-        buffer.seek(0)
+        values = [str(i) for i in range(30)]
+        values[26:30] = ["010", "010", "01", "1.5"]  # QuadClass is an INTEGER column
+        data = _zip_csv("\t".join(values) + "\n")
 
         from gdelt_client.enums import GdeltTable
 
-        result = client._parse_gdelt_file(buffer.read(), GdeltTable.EVENTS, columns)
+        result = client._parse_gdelt_file(data, GdeltTable.EVENTS, columns)
 
-        assert isinstance(result, pd.DataFrame)
+        assert result["C26"].iloc[0] == "010"
+        assert result["C28"].iloc[0] == "01"
+        assert result["C29"].iloc[0] == 1.5
+
+    def test_unzips_with_libdeflate(self, monkeypatch):
+        import types
+        import zlib
+
+        from gdelt_client.api_client import _open_zip_member
+
+        # Raw DEFLATE decompression with the libdeflate call signature
+        inflate = mock.Mock(side_effect=lambda data, size: zlib.decompress(data, -15))
+        fake = types.SimpleNamespace(deflate_decompress=inflate)
+        monkeypatch.setattr("gdelt_client.api_client.libdeflate", fake)
+
+        with _open_zip_member(_zip_csv("1\t2\n")) as member:
+            assert member.read() == b"1\t2\n"
+        fake.deflate_decompress.assert_called_once()
+        assert fake.deflate_decompress.call_args.args[1] == 4
+
+    def test_unzip_checks_crc_with_libdeflate(self, monkeypatch):
+        import types
+
+        from gdelt_client.api_client import _open_zip_member
+
+        corrupt = types.SimpleNamespace(deflate_decompress=lambda data, size: b"x" * size)
+        monkeypatch.setattr("gdelt_client.api_client.libdeflate", corrupt)
+
+        with pytest.raises(zipfile.BadZipFile, match="CRC"), _open_zip_member(_zip_csv("1\t2\n")):
+            pass
+
+    def test_streams_zip_member_without_libdeflate(self, monkeypatch):
+        from gdelt_client.api_client import _open_zip_member
+
+        monkeypatch.setattr("gdelt_client.api_client.libdeflate", None)
+
+        with _open_zip_member(_zip_csv("1\t2\n")) as member:
+            assert isinstance(member, zipfile.ZipExtFile)
+            assert member.read() == b"1\t2\n"
+
+    def test_reuses_compiled_parser_per_table(self):
+        from gdelt_client.api_client import _compile_parser
+        from gdelt_client.enums import GdeltTable
+
+        client = GdeltClient()
+        data = _zip_csv("1\t2\n")
+
+        client._parse_gdelt_file(data, GdeltTable.GKG, ["Col1", "Col2"])
+        misses = _compile_parser.cache_info().misses
+        client._parse_gdelt_file(data, GdeltTable.GKG, ["Col1", "Col2"])
+
+        assert _compile_parser.cache_info().misses == misses
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_uses_schema_types(self, monkeypatch, use_pyarrow):
+        if use_pyarrow:
+            pytest.importorskip("pyarrow")
+        else:
+            monkeypatch.setattr("gdelt_client.api_client.pa_csv", None)
+
+        from gdelt_client.enums import GdeltTable
+        from gdelt_client.helpers import load_schema
+
+        client = GdeltClient()
+        columns = load_schema("mentions")
+
+        values = ["1"] * len(columns)
+        values[2] = ""
+        data = _zip_csv("\t".join(values) + "\n")
+
+        result = client._parse_gdelt_file(data, GdeltTable.MENTIONS, columns)
+
+        assert pd.api.types.is_integer_dtype(result["GLOBALEVENTID"])
+        assert pd.api.types.is_string_dtype(result["MentionIdentifier"])
+        assert result[columns[2]].isna().all()
+
+
+class TestDownloadCache:
+    def test_reuses_cached_file(self, tmp_path):
+        from gdelt_client.enums import GdeltTable
+
+        client = GdeltClient(cache_dir=tmp_path)
+        url = "http://data.gdeltproject.org/gdeltv2/20200115234500.export.CSV.zip"
+
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.content = b"zip_content"
+        client.session = mock.Mock()
+        client.session.get.return_value = mock_response
+
+        with mock.patch.object(client, "_parse_gdelt_file", return_value=pd.DataFrame({"Col1": [1]})) as mock_parse:
+            client._download_and_parse(url, GdeltTable.EVENTS, ["Col1"])
+            client._download_and_parse(url, GdeltTable.EVENTS, ["Col1"])
+
+        assert client.session.get.call_count == 1
+        assert (tmp_path / "20200115234500.export.CSV.zip").read_bytes() == b"zip_content"
+        assert mock_parse.call_args.args[0] == b"zip_content"
+
+    def test_does_not_cache_missing_files(self, tmp_path):
+        from gdelt_client.enums import GdeltTable
+
+        client = GdeltClient(cache_dir=tmp_path)
+
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 404
+        client.session = mock.Mock()
+        client.session.get.return_value = mock_response
+
+        with pytest.warns(UserWarning, match="No data available"):
+            result = client._download_and_parse("http://test.com/file.zip", GdeltTable.EVENTS, ["Col1"])
+
+        assert result is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_keeps_download_when_cache_is_unwritable(self, tmp_path):
+        from gdelt_client.enums import GdeltTable
+
+        (tmp_path / "not_a_dir").write_bytes(b"")
+        client = GdeltClient(cache_dir=tmp_path / "not_a_dir" / "cache")
+
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.content = _zip_csv("1\t2\n")
+        client.session = mock.Mock()
+        client.session.get.return_value = mock_response
+
+        result = client._download_and_parse("http://test.com/file.zip", GdeltTable.GKG, ["Col1", "Col2"])
+
+        assert result is not None
+        assert result["Col1"].tolist() == ["1"]
+
+    def test_redownloads_corrupt_cached_file(self, tmp_path):
+        from gdelt_client.enums import GdeltTable
+
+        (tmp_path / "file.zip").write_bytes(b"truncated")
+        client = GdeltClient(cache_dir=tmp_path)
+
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.content = _zip_csv("1\t2\n")
+        client.session = mock.Mock()
+        client.session.get.return_value = mock_response
+
+        result = client._download_and_parse("http://test.com/file.zip", GdeltTable.GKG, ["Col1", "Col2"])
+
+        assert result is not None
+        assert client.session.get.call_count == 1
+        assert (tmp_path / "file.zip").read_bytes() == mock_response.content
+
+    @pytest.mark.asyncio
+    async def test_async_download_reads_cached_file(self, tmp_path):
+        from gdelt_client.enums import GdeltTable
+
+        (tmp_path / "file.zip").write_bytes(b"zip_content")
+        client = GdeltClient(cache_dir=tmp_path)
+        client.aio_session = mock.Mock()
+
+        with mock.patch.object(client, "_parse_gdelt_file", return_value=pd.DataFrame({"Col1": [1]})) as mock_parse:
+            result = await client._adownload_and_parse("http://test.com/file.zip", GdeltTable.EVENTS, ["Col1"])
+
+        assert result is not None
+        client.aio_session.get.assert_not_called()
+        mock_parse.assert_called_once_with(b"zip_content", GdeltTable.EVENTS, ["Col1"])
 
 
 class TestToGeoDataFrame:
@@ -978,6 +1379,19 @@ class TestToGeoDataFrame:
 
         assert len(result) == 1
 
+    def test_builds_points_from_lon_lat(self):
+        client = GdeltClient()
+        df = pd.DataFrame({
+            "ActionGeo_Lat": pd.array([40.7128, None, 34.0522], dtype="Float64"),
+            "ActionGeo_Long": pd.array([-74.0060, -100.0, -118.2437], dtype="Float64"),
+        })
+
+        result = client._to_geodataframe(df)
+
+        assert result.index.tolist() == [0, 2]
+        assert result.geometry.x.tolist() == [-74.0060, -118.2437]
+        assert result.geometry.y.tolist() == [40.7128, 34.0522]
+
     def test_geodataframe_output_format(self):
         from gdelt_client.enums import OutputFormat
 
@@ -1088,7 +1502,7 @@ class TestRetryBehaviorSync:
         mock_response_success.content = b'{"articles": []}'
 
         with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
+            mock.patch("requests.Session") as mock_session_class,
             mock.patch.object(client, "_get_retry_kwargs", lambda wait=None: _get_fast_retry_kwargs(client)),
         ):
             mock_session = mock.Mock()
@@ -1113,7 +1527,7 @@ class TestRetryBehaviorSync:
         mock_response_fail.reason = "Too Many Requests"
 
         with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
+            mock.patch("requests.Session") as mock_session_class,
             mock.patch.object(client, "_get_retry_kwargs", lambda wait=None: _get_fast_retry_kwargs(client)),
             pytest.raises(RateLimitError),
         ):
@@ -1137,7 +1551,7 @@ class TestRetryBehaviorSync:
         mock_response_success.content = b'{"articles": []}'
 
         with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
+            mock.patch("requests.Session") as mock_session_class,
             mock.patch.object(client, "_get_retry_kwargs", lambda wait=None: _get_fast_retry_kwargs(client)),
         ):
             mock_session = mock.Mock()
@@ -1158,7 +1572,7 @@ class TestRetryBehaviorSync:
         mock_response_fail.reason = "Too Many Requests"
 
         with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
+            mock.patch("requests.Session") as mock_session_class,
             pytest.raises(RateLimitError),
         ):
             mock_session = mock.Mock()
@@ -1184,7 +1598,7 @@ class TestRetryBehaviorSync:
         mock_response_success.content = b"mock_zip_content"
 
         with (
-            mock.patch("gdelt_client.api_client.Session") as mock_session_class,
+            mock.patch("requests.Session") as mock_session_class,
             mock.patch.object(client, "_parse_gdelt_file", return_value=pd.DataFrame({"Col1": [1]})),
             mock.patch.object(client, "_get_retry_kwargs", lambda wait=None: _get_fast_retry_kwargs(client)),
         ):
@@ -1317,3 +1731,14 @@ class TestRetryBehaviorAsync:
             result = await client._adownload_and_parse("http://test.com/file.zip", GdeltTable.EVENTS, ["Col1"])
 
             assert result is None
+
+
+class TestImportCost:
+    def test_import_does_not_load_http_clients(self):
+        import subprocess
+        import sys
+
+        code = "import sys, gdelt_client; print('requests' in sys.modules, 'aiohttp' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+        assert result.stdout.split() == ["False", "False"]
@@ -164,6 +164,14 @@ class TestTimespan:
             with pytest.raises(ValueError):
                 Filters._validate_timespan(timespan)
 
+    def test_forbids_missing_values(self):
+        with pytest.raises(ValueError, match="could not be converted into an integer"):
+            Filters._validate_timespan("h")
+
+    def test_forbids_non_ascii_digits(self):
+        with pytest.raises(ValueError, match="could not be converted into an integer"):
+            Filters._validate_timespan("²4h")
+
     def test_forbids_incorrectly_formatted_timespans(self):
         with pytest.raises(ValueError, match="is not a supported unit"):
             Filters._validate_timespan("min15")
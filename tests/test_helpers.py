@@ -1,4 +1,5 @@
-from datetime import datetime
+import math
+from datetime import UTC, datetime, timedelta, timezone
 
 import pandas as pd
 import pytest
@@ -10,11 +11,50 @@ from gdelt_client.helpers import (
     get_15min_intervals,
     get_cameo_description,
     load_cameo_codes,
+    load_json,
     load_schema,
+    load_schema_types,
     parse_date,
 )
 
 
+@pytest.fixture(scope="module")
+def cameo_codes():
+    """Bundled CAMEO lookup table, shared by the description tests (which only read it)."""
+    return load_cameo_codes()
+
+
+class TestLoadJson:
+    def test_parses_bytes(self):
+        assert load_json(b'{"articles": []}') == {"articles": []}
+
+    def test_parses_string(self):
+        assert load_json('{"articles": []}') == {"articles": []}
+
+    def test_removes_offending_characters(self):
+        assert load_json(b'{"title": "a\x01b"}') == {"title": "a b"}
+
+    def test_removes_offending_characters_after_multibyte_text(self):
+        assert load_json('{"title": "é\x01b"}'.encode()) == {"title": "é b"}
+
+    def test_parses_non_finite_numbers(self):
+        result = load_json(b'{"tone": NaN, "max": Infinity, "min": -Infinity, "title": "a\x01b"}')
+
+        assert math.isnan(result["tone"])
+        assert result["max"] == math.inf
+        assert result["min"] == -math.inf
+        assert result["title"] == "a b"
+
+    @pytest.mark.parametrize("message", [b'{"a": 1', '{"title": "é'.encode()])
+    def test_raises_value_error_for_truncated_json(self, message):
+        with pytest.raises(ValueError, match="Truncated JSON"):
+            load_json(message)
+
+    def test_raises_when_max_depth_reached(self):
+        with pytest.raises(ValueError, match="Max recursion depth"):
+            load_json(b'{"title": "a\x01\x02b"}', max_recursion_depth=1)
+
+
 class TestFormatDate:
     def test_returns_string_input(self):
         date = "2020-01-01"
@@ -24,10 +64,20 @@ class TestFormatDate:
         date = datetime(year=2020, month=1, day=1, hour=12, minute=30, second=30)
         assert format_date(date) == "20200101123030"
 
+    def test_aware_datetimes_keep_their_wall_time(self):
+        utc = datetime(2020, 1, 1, 12, tzinfo=UTC)
+        cet = datetime(2020, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        assert format_date(utc) == "20200101120000"
+        assert format_date(cet) == "20200101130000"
+
     def test_raises_for_invalid_type(self):
         with pytest.raises(ValueError, match="Unsupported type"):
             format_date(12345)
 
+    def test_raises_for_unhashable_type(self):
+        with pytest.raises(ValueError, match="Unsupported type"):
+            format_date(["2020-01-01"])
+
 
 class TestGet15MinIntervals:
     def test_returns_96_intervals(self):
@@ -59,6 +109,26 @@ class TestParseDate:
         with pytest.raises(ValueError, match="Cannot parse date"):
             parse_date("not-a-date")
 
+    def test_parses_gdelt_timestamp(self):
+        assert parse_date("20200115123000") == datetime(2020, 1, 15, 12, 30)
+
+    def test_parses_iso_datetime_with_offset(self):
+        assert parse_date("2020-01-15T12:30:00Z") == datetime(2020, 1, 15, 12, 30, tzinfo=UTC)
+
+    def test_falls_back_to_dateutil(self):
+        assert parse_date("15 January 2020") == datetime(2020, 1, 15)
+
+    def test_raises_for_invalid_gdelt_timestamp(self):
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            parse_date("20201315000000")
+
+    def test_reuses_parsed_strings(self):
+        assert parse_date("2020-01-15") is parse_date("2020-01-15")
+
+    def test_raises_for_unhashable_input(self):
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            parse_date(["2020-01-15"])  # type: ignore[arg-type]
+
 
 class TestDateRange:
     def test_returns_single_day_for_same_date(self):
@@ -76,6 +146,13 @@ class TestDateRange:
         result = date_range(start, end)
         assert len(result) == 3
 
+    def test_returns_midnights_across_month_boundary(self):
+        result = date_range("2020-01-31 18:00", datetime(2020, 2, 2, 6))
+        assert result == [datetime(2020, 1, 31), datetime(2020, 2, 1), datetime(2020, 2, 2)]
+
+    def test_returns_empty_when_end_before_start(self):
+        assert date_range("2020-01-17", "2020-01-15") == []
+
 
 class TestExpandDates:
     def test_single_date_without_coverage(self):
@@ -99,27 +176,37 @@ class TestExpandDates:
 
 
 class TestLoadSchema:
-    def test_loads_events_schema(self):
-        columns = load_schema("events")
+    @pytest.mark.parametrize("table", ["events", "mentions", "gkg"])
+    def test_loads_schema(self, table):
+        columns = load_schema(table)
         assert isinstance(columns, list)
         assert len(columns) > 0
-        assert "GLOBALEVENTID" in columns
 
-    def test_loads_mentions_schema(self):
-        columns = load_schema("mentions")
-        assert isinstance(columns, list)
-        assert len(columns) > 0
-
-    def test_loads_gkg_schema(self):
-        columns = load_schema("gkg")
-        assert isinstance(columns, list)
-        assert len(columns) > 0
+    def test_events_schema_has_event_id(self):
+        assert "GLOBALEVENTID" in load_schema("events")
 
     def test_raises_for_unknown_table(self):
         with pytest.raises(ValueError, match="Unknown table"):
             load_schema("invalid_table")
 
 
+class TestLoadSchemaTypes:
+    @pytest.mark.parametrize("table", ["events", "mentions", "gkg"])
+    def test_one_type_per_column(self, table):
+        types = load_schema_types(table)
+        assert len(types) == len(load_schema(table))
+        assert set(types) <= {"INTEGER", "FLOAT", "STRING"}
+
+    def test_event_codes_are_strings(self):
+        types = dict(zip(load_schema("events"), load_schema_types("events"), strict=True))
+        assert types["GLOBALEVENTID"] == "INTEGER"
+        assert types["EventCode"] == "STRING"
+
+    def test_raises_for_unknown_table(self):
+        with pytest.raises(ValueError, match="Unknown table"):
+            load_schema_types("invalid_table")
+
+
 class TestLoadCameoCodes:
     def test_returns_dataframe(self):
         codes = load_cameo_codes()
@@ -130,15 +217,28 @@ class TestLoadCameoCodes:
         assert "cameoCode" in codes.columns
         assert "Description" in codes.columns
 
+    def test_mutating_result_does_not_affect_cache(self):
+        codes = load_cameo_codes()
+        codes["Description"] = "changed"
+
+        assert (load_cameo_codes()["Description"] != "changed").all()
+
 
 class TestGetCameoDescription:
-    def test_returns_description_for_valid_code(self):
-        codes = load_cameo_codes()
-        desc = get_cameo_description("01", codes)
+    def test_returns_description_for_valid_code(self, cameo_codes):
+        desc = get_cameo_description("01", cameo_codes)
         assert isinstance(desc, str)
         assert "No description" not in desc
 
-    def test_returns_fallback_for_invalid_code(self):
-        codes = load_cameo_codes()
-        desc = get_cameo_description("INVALID", codes)
+    def test_returns_fallback_for_invalid_code(self, cameo_codes):
+        desc = get_cameo_description("INVALID", cameo_codes)
         assert "No description" in desc
+
+    def test_uses_bundled_codes_by_default(self, cameo_codes):
+        assert get_cameo_description("01") == get_cameo_description("01", cameo_codes)
+        assert get_cameo_description("INVALID") == "No description for CAMEO code INVALID"
+
+    def test_default_lookup_matches_bundled_table(self, cameo_codes):
+        assert all(
+            get_cameo_description(code) == get_cameo_description(code, cameo_codes) for code in cameo_codes.index
+        )
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -18,6 +18,19 @@ class TestValidateTone:
         with pytest.raises(ValueError):
             validate_tone(">=10")
 
+    @pytest.mark.parametrize("tone", ["<-5", ">2.5", "<0"])
+    def test_valid_tones_dont_raise(self, tone):
+        validate_tone(tone)
+
+    @pytest.mark.parametrize("tone", ["< 5 or > 5", ">5<", "<five", "> 5", "<-"])
+    def test_raises_for_malformed_tone(self, tone):
+        with pytest.raises(ValueError, match="Invalid tone filter"):
+            validate_tone(tone)
+
+    def test_raises_for_unsupported_type(self):
+        with pytest.raises(TypeError, match="Unsupported tone type"):
+            validate_tone(5)
+
     def test_raises_when_multiple_tones(self):
         with pytest.raises(ValueError):
             validate_tone([">5", "<10"])
@@ -46,6 +59,32 @@ class TestValidateDate:
         with pytest.raises(ValueError, match="must be before end date"):
             validate_date(["2020-01-20", "2020-01-15"])
 
+    def test_mixed_date_formats_dont_raise(self):
+        validate_date(["2020-01-15", "Jan 20 2020"])
+
+    @pytest.mark.parametrize("date", ["0001-01-01", ["0001-01-01", "2020-01-02"]])
+    def test_raises_before_gdelt_start_for_out_of_bounds_dates(self, date):
+        with pytest.raises(ValueError, match="before GDELT"):
+            validate_date(date)
+
+    @pytest.mark.parametrize("missing", [None, "", "NaT"])
+    def test_raises_for_missing_date_in_list(self, missing):
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            validate_date(["2020-01-15", missing])
+
+    def test_raises_for_future_aware_date(self):
+        with pytest.raises(ValueError, match="in the future"):
+            validate_date(datetime.now(UTC) + timedelta(days=10))
+
+    def test_raises_for_future_date_in_list(self):
+        future = datetime.now() + timedelta(days=10)
+        with pytest.raises(ValueError, match="in the future"):
+            validate_date(["2020-01-15", "2020-01-16", future])
+
+    def test_raises_for_unparseable_date(self):
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            validate_date(["2020-01-15", "not a date"])
+
     def test_raises_for_invalid_type(self):
         with pytest.raises(ValueError, match="Unsupported date type"):
             validate_date(12345)
@@ -65,3 +104,7 @@ class TestValidateTable:
     def test_raises_for_invalid_table(self):
         with pytest.raises(ValueError, match="Invalid table"):
             validate_table("invalid_table")
+
+    def test_lists_valid_tables_in_order(self):
+        with pytest.raises(ValueError, match="Must be one of: events, mentions, gkg"):
+            validate_table("invalid_table")